@@ -1,9 +1,11 @@
 """ETL use case."""
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import pandas as pd
+
 from ..domain.interfaces import (
     Extractor,
     Loader,
@@ -232,30 +234,37 @@ class ETLUseCase:
             return data
         
         window_start = get_window_start_date(window_in_days)
-        if window_start is None:
+        if window_start is None or not data:
             return data
-        
+
         logger.info("Applying window filter: keeping data from last %d days (since %s)", window_in_days, window_start)
-        
-        filtered_data = []
-        for data_point in data:
-            obs_time = data_point.get("obs_time")
-            if not isinstance(obs_time, datetime):
-                logger.warning("Data point missing valid obs_time, skipping: %s", data_point.get("internal_series_code"))
-                continue
-            
-            # Normalize timezone for comparison - convert to UTC
-            if obs_time.tzinfo is None:
-                # If naive, assume UTC
-                obs_time_utc = obs_time.replace(tzinfo=timezone.utc)
-            else:
-                obs_time_utc = obs_time.astimezone(timezone.utc)
-            
-            # Compare with window_start (which is already in UTC)
-            if obs_time_utc >= window_start:
-                filtered_data.append(data_point)
-        
-        logger.info("Window filter: %d data points kept out of %d (filtered %d)", 
+
+        # One vectorized pass: naive datetimes are assumed UTC, aware ones
+        # converted. Only datetime instances pass — anything else
+        # (including date strings) is skipped with a warning, as the
+        # pre-vectorized isinstance check did.
+        obs_times = pd.to_datetime(
+            pd.Series(
+                [
+                    data_point.get("obs_time")
+                    if isinstance(data_point.get("obs_time"), datetime)
+                    else None
+                    for data_point in data
+                ],
+                dtype=object,
+            ),
+            errors="coerce",
+            utc=True,
+        )
+        valid = obs_times.notna().to_numpy()
+        invalid_count = int(len(data) - valid.sum())
+        if invalid_count:
+            logger.warning("Skipped %d data points missing valid obs_time", invalid_count)
+
+        keep = valid & (obs_times >= window_start).to_numpy()
+        filtered_data = [data_point for data_point, kept in zip(data, keep) if kept]
+
+        logger.info("Window filter: %d data points kept out of %d (filtered %d)",
                    len(filtered_data), len(data), len(data) - len(filtered_data))
         return filtered_data
 
@@ -1,10 +1,15 @@
 """Concrete implementation of config loader."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
+try:  # libyaml's C parser, when PyYAML was built against it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
 from ..domain.interfaces import ConfigLoader
 
 
@@ -18,10 +23,15 @@ class YamlConfigLoader(ConfigLoader):
             config_dir: Directory path containing YAML configuration files.
         """
         self._config_dir = Path(config_dir)
+        self._path_cache: Dict[str, Path] = {}
+        self._parsed_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
 
     def load_dataset_config(self, dataset_id: str) -> Dict[str, Any]:
         """Load configuration for a dataset from YAML.
 
+        Repeated loads of the same dataset reuse the resolved path and
+        the parsed document; edits invalidate the cache via mtime.
+
         Args:
             dataset_id: Identifier of the dataset configuration to load.
 
@@ -31,12 +41,49 @@ class YamlConfigLoader(ConfigLoader):
         Raises:
             FileNotFoundError: If the configuration file does not exist.
         """
-        config_file = self._config_dir / f"{dataset_id}.yml"
-        if not config_file.exists():
-            config_file = self._config_dir / f"{dataset_id}.yaml"
+        config_file = self._resolve(dataset_id)
+        return self._load_parsed(config_file)
+
+    def _resolve(self, dataset_id: str) -> Path:
+        """Resolve the config file path for a dataset, preferring .yml.
+
+        Args:
+            dataset_id: Identifier of the dataset configuration.
+
+        Returns:
+            Path to the existing configuration file.
+
+        Raises:
+            FileNotFoundError: If neither extension exists.
+        """
+        cached = self._path_cache.get(dataset_id)
+        if cached is not None and cached.exists():
+            return cached
+
+        for extension in (".yml", ".yaml"):
+            candidate = self._config_dir / f"{dataset_id}{extension}"
+            if candidate.exists():
+                self._path_cache[dataset_id] = candidate
+                return candidate
+
+        raise FileNotFoundError(f"Configuration file not found for dataset: {dataset_id}")
 
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found for dataset: {dataset_id}")
+    def _load_parsed(self, config_file: Path) -> Dict[str, Any]:
+        """Parse a config file, reusing the cached document when unchanged.
+
+        Args:
+            config_file: Path to the configuration file.
+
+        Returns:
+            Parsed configuration dictionary.
+        """
+        mtime_ns = config_file.stat().st_mtime_ns
+        cached = self._parsed_cache.get(config_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
         with open(config_file, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            parsed = yaml.load(f, Loader=_SafeLoader) or {}
+
+        self._parsed_cache[config_file] = (mtime_ns, parsed)
+        return parsed
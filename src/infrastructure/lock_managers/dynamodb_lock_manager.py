@@ -1,12 +1,59 @@
 """DynamoDB-based lock manager for distributed locking."""
 
+import functools
+import logging
+import random
 import time
-from typing import Optional
+from typing import Dict, List, Optional
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from src.domain.interfaces import LockManager as LockManagerInterface
 
+logger = logging.getLogger(__name__)
+
+# DynamoDB BatchWriteItem accepts at most 25 operations per request.
+_BATCH_WRITE_MAX_ITEMS = 25
+
+# Cap UnprocessedItems retries so sustained throttling cannot spin forever.
+_BATCH_WRITE_MAX_ATTEMPTS = 5
+
+# Cap transactional lock acquisition at one atomic request.
+_TRANSACT_MAX_ITEMS = 25
+
+# Retry policy for contended lock acquisition: capped jittered backoff.
+_ACQUIRE_MAX_ATTEMPTS = 5
+_ACQUIRE_BACKOFF_BASE_SECONDS = 0.05
+_ACQUIRE_BACKOFF_CAP_SECONDS = 2.0
+
+# Throttling/transport retries are delegated to botocore's adaptive mode.
+_CLIENT_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 5})
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_session(
+    region_name: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+) -> boto3.Session:
+    """Get or create a boto3 Session for the given credential tuple.
+
+    Sessions are cached per (region, credentials) so the credential
+    resolution chain runs once per process instead of once per manager.
+    """
+    kwargs = {
+        k: v
+        for k, v in {
+            "region_name": region_name,
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key,
+        }.items()
+        if v is not None
+    }
+    return boto3.Session(**kwargs)
+
 
 class DynamoDBLockManager(LockManagerInterface):
     """DynamoDB-based lock manager for distributed locking.
@@ -20,6 +67,7 @@ class DynamoDBLockManager(LockManagerInterface):
         region_name: Optional[str] = None,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        consistent_read: bool = True,
     ):
         """Initialize DynamoDB lock manager.
 
@@ -28,26 +76,32 @@ class DynamoDBLockManager(LockManagerInterface):
             region_name: AWS region name (optional, uses default if not provided).
             aws_access_key_id: AWS access key ID (optional, can use IAM role).
             aws_secret_access_key: AWS secret access key (optional, can use IAM role).
+            consistent_read: Use strongly consistent reads when inspecting
+                locks (default: True). Eventually consistent reads can
+                report a lock as held after it was released, forcing a
+                wasted retry cycle.
         """
         self._table_name = table_name
         self._region_name = region_name
         self._aws_access_key_id = aws_access_key_id
         self._aws_secret_access_key = aws_secret_access_key
+        self._consistent_read = consistent_read
         self._client = None
 
+    @property
+    def consistent_read(self) -> bool:
+        """Whether lock inspection uses strongly consistent reads."""
+        return self._consistent_read
+
     def _get_client(self):
-        """Get or create DynamoDB client."""
+        """Get or create DynamoDB client from the shared session."""
         if self._client is None:
-            kwargs = {
-                k: v
-                for k, v in {
-                    "region_name": self._region_name,
-                    "aws_access_key_id": self._aws_access_key_id,
-                    "aws_secret_access_key": self._aws_secret_access_key,
-                }.items()
-                if v is not None
-            }
-            self._client = boto3.client("dynamodb", **kwargs)
+            session = _shared_session(
+                self._region_name,
+                self._aws_access_key_id,
+                self._aws_secret_access_key,
+            )
+            self._client = session.client("dynamodb", config=_CLIENT_CONFIG)
 
         return self._client
 
@@ -55,7 +109,8 @@ class DynamoDBLockManager(LockManagerInterface):
         """Acquire a lock for the given key.
 
         Uses DynamoDB conditional write to atomically acquire lock.
-        Lock expires after timeout_seconds.
+        Lock expires after timeout_seconds. Under contention, retries
+        with capped jittered backoff before giving up.
 
         Args:
             lock_key: Unique identifier for the lock.
@@ -64,47 +119,199 @@ class DynamoDBLockManager(LockManagerInterface):
         Returns:
             True if lock was acquired, False if already locked.
         """
+        client = self._get_client()
+        retry_budget_seconds = timeout_seconds / 2
+
+        for attempt in range(_ACQUIRE_MAX_ATTEMPTS):
+            current_time = int(time.time())
+            expiration_time = current_time + timeout_seconds
+
+            try:
+                client.put_item(
+                    TableName=self._table_name,
+                    Item={
+                        "lock_key": {"S": lock_key},
+                        "expiration_time": {"N": str(expiration_time)},
+                        "acquired_at": {"N": str(current_time)},
+                    },
+                    ConditionExpression="attribute_not_exists(lock_key) OR expiration_time < :current_time",
+                    ExpressionAttributeValues={
+                        ":current_time": {"N": str(current_time)},
+                    },
+                )
+                return True
+            except client.exceptions.ConditionalCheckFailedException:
+                if attempt == _ACQUIRE_MAX_ATTEMPTS - 1:
+                    break
+                delay_cap = min(
+                    _ACQUIRE_BACKOFF_CAP_SECONDS,
+                    _ACQUIRE_BACKOFF_BASE_SECONDS * (2 ** attempt),
+                )
+                if delay_cap > retry_budget_seconds:
+                    break
+                time.sleep(random.uniform(0, delay_cap))
+
+        return False
+
+    def acquire_many(
+        self, lock_keys: List[str], timeout_seconds: int = 300
+    ) -> Dict[str, bool]:
+        """Atomically acquire a set of locks in one request.
+
+        Uses TransactWriteItems so either every lock is acquired or none
+        is, replacing N conditional PutItem round-trips with one RPC.
+
+        Args:
+            lock_keys: Unique identifiers for the locks (max 25).
+            timeout_seconds: Lock expiration time in seconds (default: 300).
+
+        Returns:
+            Dictionary mapping each lock_key to whether it was acquired.
+            All values are True on success and False when the transaction
+            was cancelled (no lock is held in that case).
+
+        Raises:
+            ValueError: If more than 25 keys are requested.
+        """
+        if not lock_keys:
+            return {}
+        if len(lock_keys) > _TRANSACT_MAX_ITEMS:
+            raise ValueError(
+                f"Cannot atomically acquire more than {_TRANSACT_MAX_ITEMS} locks"
+            )
+
         client = self._get_client()
         current_time = int(time.time())
         expiration_time = current_time + timeout_seconds
 
+        transact_items = [
+            {
+                "Put": {
+                    "TableName": self._table_name,
+                    "Item": {
+                        "lock_key": {"S": lock_key},
+                        "expiration_time": {"N": str(expiration_time)},
+                        "acquired_at": {"N": str(current_time)},
+                    },
+                    "ConditionExpression": (
+                        "attribute_not_exists(lock_key) OR expiration_time < :current_time"
+                    ),
+                    "ExpressionAttributeValues": {
+                        ":current_time": {"N": str(current_time)},
+                    },
+                }
+            }
+            for lock_key in lock_keys
+        ]
+
         try:
-            client.put_item(
-                TableName=self._table_name,
-                Item={
-                    "lock_key": {"S": lock_key},
-                    "expiration_time": {"N": str(expiration_time)},
-                    "acquired_at": {"N": str(current_time)},
-                },
-                ConditionExpression="attribute_not_exists(lock_key) OR expiration_time < :current_time",
-                ExpressionAttributeValues={
-                    ":current_time": {"N": str(current_time)},
-                },
-            )
-            return True
-        except client.exceptions.ConditionalCheckFailedException:
+            client.transact_write_items(TransactItems=transact_items)
+            return {lock_key: True for lock_key in lock_keys}
+        except client.exceptions.TransactionCanceledException as e:
+            reasons = getattr(e, "response", {}).get("CancellationReasons", [])
+            contended = [
+                lock_key
+                for lock_key, reason in zip(lock_keys, reasons)
+                if reason.get("Code") == "ConditionalCheckFailed"
+            ]
+            if contended:
+                logger.warning("Lock acquisition cancelled, contended keys: %s", contended)
+            return {lock_key: False for lock_key in lock_keys}
+
+    def is_locked(self, lock_key: str) -> bool:
+        """Check whether an unexpired lock currently exists for the key.
+
+        Reads use ConsistentRead per the manager's configuration so the
+        answer reflects the latest acquire/release instead of a stale
+        replica.
+
+        Args:
+            lock_key: Unique identifier for the lock.
+
+        Returns:
+            True if an unexpired lock row exists, False otherwise.
+        """
+        client = self._get_client()
+
+        response = client.get_item(
+            TableName=self._table_name,
+            Key={"lock_key": {"S": lock_key}},
+            ConsistentRead=self._consistent_read,
+        )
+        item = response.get("Item")
+        if not item:
             return False
 
+        expiration_time = int(item["expiration_time"]["N"])
+        return expiration_time >= int(time.time())
+
     def release(self, lock_key: str) -> None:
         """Release a lock for the given key.
 
+        Marks the lock as already expired instead of deleting the row:
+        a later acquire() treats it as free, and DynamoDB's TTL sweep on
+        expiration_time removes the item asynchronously at no write cost.
+
         Args:
             lock_key: Unique identifier for the lock.
         """
         client = self._get_client()
 
-        # Get exception types that may be raised (if available)
-        resource_not_found = getattr(client.exceptions, "ResourceNotFoundException", None)
-        client_error = getattr(client.exceptions, "ClientError", None)
-
         try:
-            client.delete_item(
+            client.update_item(
                 TableName=self._table_name,
                 Key={"lock_key": {"S": lock_key}},
+                UpdateExpression="SET expiration_time = :expired",
+                ConditionExpression="attribute_exists(lock_key)",
+                ExpressionAttributeValues={
+                    ":expired": {"N": str(int(time.time()) - 1)},
+                },
             )
-        except Exception as e:
-            if resource_not_found is not None and isinstance(e, resource_not_found):
-                return
-            if client_error is not None and isinstance(e, client_error):
-                return
-            raise
+        except ClientError:
+            # Missing row, missing table, or similar — the lock is
+            # effectively free already, so release is a no-op.
+            return
+
+    def release_many(self, lock_keys: List[str]) -> None:
+        """Release multiple locks in one pass using BatchWriteItem.
+
+        Chunks deletions into DynamoDB's 25-operation batch limit and
+        retries any UnprocessedItems with exponential backoff, turning
+        O(N) per-key round-trips into O(ceil(N/25)) batch requests.
+        Retries are bounded; keys still unprocessed after the last
+        attempt are logged and left to expire via their TTL.
+
+        Args:
+            lock_keys: Unique identifiers of the locks to release.
+        """
+        client = self._get_client()
+
+        for start in range(0, len(lock_keys), _BATCH_WRITE_MAX_ITEMS):
+            chunk = lock_keys[start:start + _BATCH_WRITE_MAX_ITEMS]
+            request_items = {
+                self._table_name: [
+                    {"DeleteRequest": {"Key": {"lock_key": {"S": key}}}}
+                    for key in chunk
+                ]
+            }
+
+            for attempt in range(_BATCH_WRITE_MAX_ATTEMPTS):
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+                if attempt == _BATCH_WRITE_MAX_ATTEMPTS - 1:
+                    unreleased = [
+                        request["DeleteRequest"]["Key"]["lock_key"]["S"]
+                        for request in request_items.get(self._table_name, [])
+                    ]
+                    # Locks expire on their own, so give up with a log
+                    # instead of raising, matching release().
+                    logger.error(
+                        "Gave up releasing %d lock(s) after %d attempts: %s",
+                        len(unreleased),
+                        _BATCH_WRITE_MAX_ATTEMPTS,
+                        unreleased,
+                    )
+                    break
+                time.sleep(min(2.0, 0.05 * (2 ** attempt)))
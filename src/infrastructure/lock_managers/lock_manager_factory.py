@@ -45,6 +45,7 @@ class LockManagerFactory:
                 region_name=lock_config.get("region_name"),
                 aws_access_key_id=lock_config.get("aws_access_key_id"),
                 aws_secret_access_key=lock_config.get("aws_secret_access_key"),
+                consistent_read=lock_config.get("consistent_read", True),
             )
 
         raise ValueError(f"Unhandled lock manager kind: {kind}")  # pragma: no cover
@@ -1,14 +1,80 @@
 """Projection notification service for HTTP POST."""
 
-import json
+import atexit
 import logging
+import queue
+import threading
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Build the shared keep-alive session for notifications.
+
+    A single session reuses TCP/TLS connections across notifications
+    instead of paying a handshake per POST, and retries transient
+    gateway errors with backoff.
+
+    Returns:
+        Configured requests session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_session()
+
+# One queue and worker serve every service instance, mirroring
+# _SHARED_SESSION: server/lambda deployments build a fresh service per
+# run, and a per-instance thread plus atexit entry would accumulate for
+# the life of the process.
+_SHARED_QUEUE: queue.Queue = queue.Queue()
+_WORKER_LOCK = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+
+def _drain() -> None:
+    """Worker loop: POST queued events until the process exits."""
+    while True:
+        service, url, event = _SHARED_QUEUE.get()
+        try:
+            service._post(url, event)  # noqa: SLF001
+        finally:
+            _SHARED_QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    """Start the shared drain worker on first use."""
+    global _worker
+    with _WORKER_LOCK:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_drain, name="projection-notify", daemon=True
+            )
+            _worker.start()
+
+
+# The worker is a daemon thread, so without this the interpreter can
+# exit (the CLI sys.exit()s right after the pipeline) while events are
+# still queued, silently dropping them. atexit runs before daemon
+# threads are killed, so the queue drains first.
+atexit.register(_SHARED_QUEUE.join)
+
+
 class ProjectionNotificationService:
     """Service for publishing projection update notifications via HTTP POST."""
 
@@ -20,11 +86,13 @@ class ProjectionNotificationService:
         Args:
             base_url: Base URL for the notification endpoint.
             timeout: Request timeout in seconds (default: 30.0).
-            http_client: Requests client (optional, for testing).
+            http_client: HTTP client with a requests-style post method
+                (optional, for testing). Defaults to the shared
+                keep-alive session.
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._http_client = http_client or requests
+        self._http_client = http_client or _SHARED_SESSION
 
     def notify_projection_update(
         self,
@@ -33,7 +101,10 @@ class ProjectionNotificationService:
         version_manifest_path: str,
         projections_path: str,
     ) -> None:
-        """Publish a projection update notification via HTTP POST.
+        """Enqueue a projection update notification for background POST.
+
+        Returns immediately; the POST happens on the background worker.
+        Call flush() to wait for queued notifications to be attempted.
 
         Args:
             dataset_id: Dataset identifier.
@@ -57,9 +128,26 @@ class ProjectionNotificationService:
             url,
         )
 
+        # Notifications are fire-and-forget: failures are swallowed, so
+        # callers never need a synchronous ack. The shared daemon worker
+        # drains the queue off the projection critical path.
+        _ensure_worker()
+        _SHARED_QUEUE.put((self, url, event))
+
+    def flush(self) -> None:
+        """Block until every queued notification has been attempted."""
+        _SHARED_QUEUE.join()
+
+    def _post(self, url: str, event: dict) -> None:
+        """POST a single event, swallowing failures.
+
+        Args:
+            url: Notification endpoint URL.
+            event: Event payload.
+        """
         try:
             response = self._http_client.post(
-                url,
+                url=url,
                 json=event,
                 headers={"Content-Type": "application/json"},
                 timeout=self._timeout,
@@ -67,7 +155,7 @@ class ProjectionNotificationService:
             response.raise_for_status()
             logger.info(
                 "Successfully published projection update notification for dataset %s",
-                dataset_id,
+                event["dataset_id"],
             )
         except Exception as e:  # noqa: BLE001
             logger.error(
@@ -76,4 +164,3 @@ class ProjectionNotificationService:
                 exc_info=True,
             )
             # Don't raise - notification failure shouldn't break the projection
-
@@ -7,6 +7,9 @@ import pytz
 
 from src.domain.interfaces import Normalizer
 
+# Translation table for numeric strings: decimal comma -> dot, spaces removed.
+_DECIMAL_TABLE = str.maketrans({",": ".", " ": None})
+
 
 class BcraInfomondiaNormalizer(Normalizer):
     """Normalizer for BCRA Infomondia parsed data."""
@@ -30,28 +33,29 @@ class BcraInfomondiaNormalizer(Normalizer):
         primary_keys = normalize_config.get("primary_keys", [])
         
         timezone = pytz.timezone(timezone_str)
+        deduplicate = bool(primary_keys)
         normalized = []
-        seen = set()
-        
+        seen: Dict[Any, None] = {}
+
         for data_point in data:
             internal_series_code = data_point.get("internal_series_code")
             if not internal_series_code:
                 continue
-            
+
             obs_time = self._parse_datetime(data_point.get("obs_time"), timezone)
             if obs_time is None:
                 continue
-            
+
             value = self._normalize_value(data_point.get("value"))
             if value is None:
                 continue
-            
-            dedup_key = (obs_time, internal_series_code) if primary_keys else None
-            if dedup_key and dedup_key in seen:
-                continue
-            if dedup_key:
-                seen.add(dedup_key)
-            
+
+            if deduplicate:
+                dedup_key = (obs_time, internal_series_code)
+                if dedup_key in seen:
+                    continue
+                seen[dedup_key] = None
+
             normalized.append({
                 "obs_time": obs_time,
                 "internal_series_code": str(internal_series_code),
@@ -99,12 +103,12 @@ class BcraInfomondiaNormalizer(Normalizer):
             return float(value)
         
         if isinstance(value, str):
-            cleaned = value.replace(",", ".").replace(" ", "").strip()
+            cleaned = value.translate(_DECIMAL_TABLE).strip()
             if not cleaned:
                 return None
             try:
                 return float(cleaned)
             except ValueError:
                 return None
-        
+
         return None
@@ -4,6 +4,7 @@ import io
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
+import pandas as pd
 from openpyxl import load_workbook
 
 from src.domain.interfaces import Parser
@@ -35,19 +36,25 @@ class BcraInfomondiaParser(Parser):
         """
         parse_config = config.get("parse_config", {})
         series_map = parse_config.get("series_map", [])
-        
+
+        if not series_map:
+            return []
+
         workbook = self._load_workbook(raw_data)
         parsed_data: List[SeriesDataPoint] = []
-        
+        sheet_cache: Dict[str, List[tuple]] = {}
+
         try:
             for series_config in series_map:
                 series_code = str(series_config.get("internal_series_code", ""))
                 last_date = series_last_dates.get(series_code) if series_last_dates else None
-                series_data = self._extract_series(workbook, series_config, last_date)
+                series_data = self._extract_series(
+                    workbook, series_config, last_date, sheet_cache
+                )
                 parsed_data.extend(series_data)
         finally:
             workbook.close()
-        
+
         return parsed_data
     
     def _load_workbook(self, raw_data: bytes):
@@ -63,27 +70,38 @@ class BcraInfomondiaParser(Parser):
         return load_workbook(excel_file, data_only=True, read_only=True)
     
     def _extract_series(
-        self, 
-        workbook, 
+        self,
+        workbook,
         series_config: Dict[str, Union[str, int, bool]],
-        last_date: Optional[datetime] = None
+        last_date: Optional[datetime] = None,
+        sheet_cache: Optional[Dict[str, List[tuple]]] = None
     ) -> List[SeriesDataPoint]:
         """Extract data for a single series from the workbook.
-        
+
         Args:
             workbook: OpenPyXL workbook object.
             series_config: Configuration for the series to extract.
             last_date: Last processed date for this series (filters dates <= last_date).
-            
+            sheet_cache: Per-parse cache of sheet rows, so series sharing a
+                sheet read its XML only once.
+
         Returns:
             List of dictionaries containing series data points.
         """
         sheet_name = series_config["sheet"]
-        
+
         if sheet_name not in workbook.sheetnames:
             return []
-        
-        sheet = workbook[sheet_name]
+
+        if sheet_cache is None:
+            sheet_cache = {}
+
+        rows = sheet_cache.get(sheet_name)
+        if rows is None:
+            sheet = workbook[sheet_name]
+            rows = list(sheet.iter_rows(values_only=True))
+            sheet_cache[sheet_name] = rows
+
         header_row = series_config["header_row"]
         date_col = series_config["date_col"]
         value_col = series_config["value_col"]
@@ -92,31 +110,65 @@ class BcraInfomondiaParser(Parser):
         
         date_col_idx = excel_column_to_index(date_col)
         value_col_idx = excel_column_to_index(value_col)
-        
+        naive_last_date = to_naive(last_date) if last_date else None
+        start_row = header_row + skip_rows_after_header
+
         dates: List[Optional[CellValue]] = []
         values: List[Optional[CellValue]] = []
-        
-        for row in sheet.iter_rows(
-            min_row=header_row + skip_rows_after_header,
-            values_only=True
-        ):
-            date = row[date_col_idx] if date_col_idx < len(row) else None
-            value = row[value_col_idx] if value_col_idx < len(row) else None
-            
-            if last_date and isinstance(date, datetime):
-                if date <= to_naive(last_date):
-                    continue
-            
-            dates.append(date)
-            values.append(value)
-        
+
+        for row in rows[start_row - 1:]:
+            dates.append(row[date_col_idx] if date_col_idx < len(row) else None)
+            values.append(row[value_col_idx] if value_col_idx < len(row) else None)
+
+        if naive_last_date is not None and dates:
+            dates, values = self._filter_by_last_date(dates, values, naive_last_date)
+
         return self._build_series_data(
-            series_config, 
-            dates, 
-            values, 
+            series_config,
+            dates,
+            values,
             drop_na
         )
-    
+
+    @staticmethod
+    def _filter_by_last_date(
+        dates: List[Optional[CellValue]],
+        values: List[Optional[CellValue]],
+        naive_last_date: datetime,
+    ):
+        """Drop rows already covered by the last processed date.
+
+        Builds one vectorized datetime mask over the whole date column
+        instead of comparing row-by-row in Python. Only datetime cells
+        are compared; anything else (headers, blanks, date strings) maps
+        to NaT and is kept, matching the previous row-wise isinstance
+        behaviour.
+
+        Args:
+            dates: List of date values.
+            values: List of value values.
+            naive_last_date: Naive cutoff; rows at or before it are dropped.
+
+        Returns:
+            Tuple of filtered (dates, values) lists.
+        """
+        parsed = pd.to_datetime(
+            pd.Series(
+                [date if isinstance(date, datetime) else None for date in dates],
+                dtype=object,
+            ),
+            errors="coerce",
+        )
+        keep = (parsed.isna() | (parsed > naive_last_date)).to_numpy()
+
+        if keep.all():
+            return dates, values
+
+        return (
+            [date for date, kept in zip(dates, keep) if kept],
+            [value for value, kept in zip(values, keep) if kept],
+        )
+
     def _build_series_data(
         self,
         series_config: Dict[str, Union[str, int, bool]],
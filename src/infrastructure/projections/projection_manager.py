@@ -128,7 +128,10 @@ class ProjectionManager:
         merger = ProjectionMerger(
             bucket=self._bucket, s3_client=self._s3_client, merge_workers=self._merge_workers
         )
-        merger.merge_all_partitions(dataset_id)
+        try:
+            merger.merge_all_partitions(dataset_id)
+        finally:
+            merger.close()
 
     def _atomic_move_to_projections(self, dataset_id: str) -> None:
         """Move staging to projections atomically.
@@ -1,13 +1,16 @@
 """Projection merger for merging staging data with projections."""
 
-import json
+import heapq
 import logging
+import os
 import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from src.infrastructure.projections.staging_manager import StagingManager
@@ -15,6 +18,15 @@ from src.infrastructure.utils.aws_utils import create_s3_client
 
 logger = logging.getLogger(__name__)
 
+# Multipart upload settings for merged partition files: parts above the
+# threshold upload in parallel threads instead of one blocking PUT.
+_UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
 
 class ProjectionMerger:
     """Merges staging data with existing projections."""
@@ -25,7 +37,7 @@ class ProjectionMerger:
         s3_client: Any = None,
         aws_region: str = "us-east-1",
         compression: str = "snappy",
-        merge_workers: int = 1,
+        merge_workers: Optional[int] = 1,
     ):
         """Initialize ProjectionMerger.
 
@@ -34,29 +46,108 @@ class ProjectionMerger:
             s3_client: Boto3 S3 client (optional, for testing).
             aws_region: AWS region (default: us-east-1).
             compression: Compression codec (default: "snappy").
-            merge_workers: Number of parallel workers for merging partitions (default: 1, sequential).
+            merge_workers: Number of parallel workers for merging partitions
+                (default: 1, sequential). Pass None to size the pool from
+                the host's CPU count.
         """
+        if merge_workers is None:
+            merge_workers = self._default_merge_workers()
         self._bucket = bucket
-        self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
+        # Each merge worker holds two downloads in flight, so size the
+        # connection pool accordingly when we own the client.
+        self._s3_client = create_s3_client(
+            aws_region=aws_region,
+            s3_client=s3_client,
+            max_pool_connections=max(16, merge_workers * 2),
+        )
         self._compression = compression
         self._merge_workers = merge_workers
+        # One long-lived pool amortizes thread startup across repeated
+        # merge_all_partitions calls; sequential mergers skip the pool.
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=merge_workers, thread_name_prefix="proj-merge")
+            if merge_workers > 1
+            else None
+        )
+
+    @staticmethod
+    def _default_merge_workers() -> int:
+        """Compute a worker count from the host's CPU count.
+
+        Partition merges are I/O-heavy, so the pool is oversubscribed at
+        twice the core count, clamped to [4, 32].
+
+        Returns:
+            Number of merge workers.
+        """
+        return min(32, max(4, (os.cpu_count() or 4) * 2))
+
+    def close(self) -> None:
+        """Shut down the worker pool, waiting for in-flight merges."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ProjectionMerger":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-    def merge_partition(self, dataset_id: str, partition_path: str) -> None:
+    def merge_partition(
+        self,
+        dataset_id: str,
+        partition_path: str,
+        existing_keys: Optional[Dict[str, str]] = None,
+        merge_state: Optional[Dict[str, str]] = None,
+    ) -> None:
         """Merge a single partition from staging with projections.
 
         Args:
             dataset_id: Dataset identifier.
             partition_path: Partition path (e.g., "SERIES_1/year=2024/month=01").
+            existing_keys: Pre-listed S3 keys mapped to their ETags
+                (optional). When given, existence checks consult this
+                mapping instead of issuing per-key HeadObject calls.
+            merge_state: Partition-path-to-ETag mapping from the last
+                successful merge (optional). Partitions whose staging
+                ETag is unchanged are skipped entirely; the mapping is
+                updated in place after a successful upload.
         """
-        logger.info("Merging partition %s for dataset %s", partition_path, dataset_id)
-
         staging_key = self._build_staging_file_key(dataset_id, partition_path)
         projections_key = self._build_projections_file_key(dataset_id, partition_path)
 
+        if merge_state is not None and existing_keys is not None:
+            staging_etag = existing_keys.get(staging_key)
+            if staging_etag is not None and merge_state.get(partition_path) == staging_etag:
+                logger.info(
+                    "Skipping partition %s: staging unchanged since last merge",
+                    partition_path,
+                )
+                return
+
+        logger.info("Merging partition %s for dataset %s", partition_path, dataset_id)
+
         with tempfile.TemporaryDirectory() as tmpdir:
-            # Download files if they exist
-            staging_data = self._download_and_read_json(staging_key, tmpdir)
-            projections_data = self._download_and_read_json(projections_key, tmpdir)
+            # The two downloads are independent network I/O; fetch them
+            # concurrently under distinct local names.
+            with ThreadPoolExecutor(max_workers=2) as downloader:
+                staging_future = downloader.submit(
+                    self._download_and_read_json,
+                    staging_key,
+                    tmpdir,
+                    "staging.json",
+                    existing_keys,
+                )
+                projections_future = downloader.submit(
+                    self._download_and_read_json,
+                    projections_key,
+                    tmpdir,
+                    "projections.json",
+                    existing_keys,
+                )
+                staging_data = staging_future.result()
+                projections_data = projections_future.result()
 
             # Merge data
             merged_data = self._merge_json_data(projections_data, staging_data)
@@ -66,9 +157,24 @@ class ProjectionMerger:
                 output_file = Path(tmpdir) / "merged.json"
                 self._write_json(merged_data, output_file)
                 self._upload_to_staging(staging_key, output_file)
+                if merge_state is not None:
+                    self._record_merged_etag(merge_state, partition_path, staging_key)
 
         logger.info("Successfully merged partition %s", partition_path)
 
+    def _record_merged_etag(
+        self, merge_state: Dict[str, str], partition_path: str, staging_key: str
+    ) -> None:
+        """Record the post-upload staging ETag for a merged partition.
+
+        Args:
+            merge_state: Partition-path-to-ETag mapping to update.
+            partition_path: Partition path just merged.
+            staging_key: S3 key of the uploaded staging file.
+        """
+        response = self._s3_client.head_object(Bucket=self._bucket, Key=staging_key)
+        merge_state[partition_path] = response["ETag"]
+
     def merge_all_partitions(self, dataset_id: str) -> None:
         """Merge all partitions in staging with projections.
 
@@ -80,32 +186,120 @@ class ProjectionMerger:
 
         logger.info("Merging %d partition(s) for dataset %s", len(partitions), dataset_id)
 
-        self._merge_all_partitions_parallel(dataset_id, partitions)
+        # One prefix listing up front replaces two HeadObject round trips
+        # per partition in the existence checks below, and carries the
+        # ETags used to skip partitions untouched since the last merge.
+        existing_keys = self._list_existing_keys(dataset_id)
+        merge_state = self._load_merge_state(dataset_id)
+
+        if self._executor is None:
+            for partition_path in partitions:
+                self.merge_partition(dataset_id, partition_path, existing_keys, merge_state)
+        else:
+            self._merge_all_partitions_parallel(
+                dataset_id, partitions, existing_keys, merge_state
+            )
+
+        self._save_merge_state(dataset_id, merge_state)
 
         logger.info("Successfully merged all partitions")
 
-    def _merge_all_partitions_parallel(self, dataset_id: str, partitions: List[str]) -> None:
-        """Merge all partitions in parallel using ThreadPoolExecutor."""
+    def _list_existing_keys(self, dataset_id: str) -> Dict[str, str]:
+        """List staging and projection keys for a dataset with their ETags.
+
+        Only these two prefixes feed the existence checks; listing the
+        whole dataset prefix would also sweep every object under
+        versions/, which grows with each load and is never consulted.
+
+        Args:
+            dataset_id: Dataset identifier.
+
+        Returns:
+            Mapping of S3 key to ETag for the staging and projection areas.
+        """
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        existing_keys: Dict[str, str] = {}
+        for area in ("staging", "projections"):
+            for page in paginator.paginate(
+                Bucket=self._bucket, Prefix=f"datasets/{dataset_id}/{area}/"
+            ):
+                for obj in page.get("Contents", []):
+                    existing_keys[obj["Key"]] = obj.get("ETag", "")
+        return existing_keys
+
+    def _build_merge_state_key(self, dataset_id: str) -> str:
+        """Build S3 key for the sidecar merge-state object.
+
+        Args:
+            dataset_id: Dataset identifier.
+
+        Returns:
+            S3 key string.
+        """
+        return f"datasets/{dataset_id}/.merge_state.json"
+
+    def _load_merge_state(self, dataset_id: str) -> Dict[str, str]:
+        """Load the partition-to-ETag state from the last merge.
+
+        Args:
+            dataset_id: Dataset identifier.
+
+        Returns:
+            Mapping of partition path to staging ETag; empty if absent.
+        """
+        try:
+            response = self._s3_client.get_object(
+                Bucket=self._bucket, Key=self._build_merge_state_key(dataset_id)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return {}
+            raise
+        return orjson.loads(response["Body"].read())
+
+    def _save_merge_state(self, dataset_id: str, merge_state: Dict[str, str]) -> None:
+        """Persist the partition-to-ETag state for the next merge.
+
+        Args:
+            dataset_id: Dataset identifier.
+            merge_state: Mapping of partition path to staging ETag.
+        """
+        self._s3_client.put_object(
+            Bucket=self._bucket,
+            Key=self._build_merge_state_key(dataset_id),
+            Body=orjson.dumps(merge_state),
+            ContentType="application/json",
+        )
+
+    def _merge_all_partitions_parallel(
+        self,
+        dataset_id: str,
+        partitions: List[str],
+        existing_keys: Dict[str, str],
+        merge_state: Dict[str, str],
+    ) -> None:
+        """Merge all partitions in parallel on the shared worker pool."""
         logger.info("Merging %d partitions in parallel with %d workers", len(partitions), self._merge_workers)
 
         completed_count = 0
         total_partitions = len(partitions)
 
-        with ThreadPoolExecutor(max_workers=self._merge_workers) as executor:
-            future_to_partition = {
-                executor.submit(self.merge_partition, dataset_id, partition_path): partition_path
-                for partition_path in partitions
-            }
-
-            for future in as_completed(future_to_partition):
-                completed_count += 1
-                partition_path = future_to_partition[future]
-                logger.debug("Completed merging partition %d/%d: %s", completed_count, total_partitions, partition_path)
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error("Failed to merge partition %s: %s", partition_path, e)
-                    raise
+        future_to_partition = {
+            self._executor.submit(
+                self.merge_partition, dataset_id, partition_path, existing_keys, merge_state
+            ): partition_path
+            for partition_path in partitions
+        }
+
+        for future in as_completed(future_to_partition):
+            completed_count += 1
+            partition_path = future_to_partition[future]
+            logger.debug("Completed merging partition %d/%d: %s", completed_count, total_partitions, partition_path)
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Failed to merge partition %s: %s", partition_path, e)
+                raise
 
     def _build_staging_file_key(self, dataset_id: str, partition_path: str) -> str:
         """Build S3 key for staging file.
@@ -131,29 +325,44 @@ class ProjectionMerger:
         """
         return f"datasets/{dataset_id}/projections/{partition_path}/data.json"
 
-    def _download_and_read_json(self, s3_key: str, tmpdir: str) -> Optional[List[Dict[str, Any]]]:
+    def _download_and_read_json(
+        self,
+        s3_key: str,
+        tmpdir: str,
+        local_name: Optional[str] = None,
+        existing_keys: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
         """Download JSON file from S3 and read it.
 
         Args:
             s3_key: S3 object key.
             tmpdir: Temporary directory path.
+            local_name: Local file name (defaults to the key's basename;
+                pass distinct names for concurrent downloads of keys that
+                share a basename).
+            existing_keys: Pre-listed S3 keys; when given, used for the
+                existence check instead of a HeadObject call.
 
         Returns:
             List of data dictionaries, or None if file doesn't exist.
         """
-        if not self._s3_object_exists(s3_key):
+        if existing_keys is not None:
+            if s3_key not in existing_keys:
+                return None
+        elif not self._s3_object_exists(s3_key):
             return None
 
-        local_file = Path(tmpdir) / Path(s3_key).name
+        local_file = Path(tmpdir) / (local_name or Path(s3_key).name)
         self._s3_client.download_file(self._bucket, s3_key, str(local_file))
 
-        with open(local_file, encoding="utf-8") as f:
-            data = json.load(f)
-            # Handle both list and dict formats
-            if isinstance(data, dict):
-                # If it's a dict, assume it has a 'data' key or convert to list
-                return data.get("data", [data])
-            return data if isinstance(data, list) else []
+        # orjson parses the raw bytes directly, skipping the text-decode
+        # layer json.load would add on top.
+        data = orjson.loads(local_file.read_bytes())
+        # Handle both list and dict formats
+        if isinstance(data, dict):
+            # If it's a dict, assume it has a 'data' key or convert to list
+            return data.get("data", [data])
+        return data if isinstance(data, list) else []
 
     def _s3_object_exists(self, s3_key: str) -> bool:
         """Check if S3 object exists.
@@ -172,17 +381,39 @@ class ProjectionMerger:
                 return False
             raise
 
+    @staticmethod
+    def _merge_sort_key(item: Dict[str, Any]) -> tuple:
+        """Build the (internal_series_code, obs_time) sort key for a record.
+
+        ISO-formatted obs_time strings sort chronologically, so datetimes
+        are normalized to their isoformat representation.
+        """
+        obs_time = item.get("obs_time")
+        if isinstance(obs_time, datetime):
+            obs_time_key = obs_time.isoformat()
+        else:
+            obs_time_key = str(obs_time) if obs_time else ""
+
+        internal_series_code = item.get("internal_series_code")
+        return (str(internal_series_code) if internal_series_code else "", obs_time_key)
+
     def _merge_json_data(
         self, projections_data: Optional[List[Dict[str, Any]]], staging_data: Optional[List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """Merge projections and staging data, removing duplicates.
 
+        Each side is sorted once by (internal_series_code, obs_time) and
+        streamed through a 2-way heap merge with a single-pass dedup,
+        avoiding the combined intermediate list and the key set. Because
+        heapq.merge is stable, the projections-side record wins on
+        duplicate keys.
+
         Args:
             projections_data: Existing projections data (can be None).
             staging_data: New staging data (can be None).
 
         Returns:
-            Merged list of data dictionaries.
+            Merged list of data dictionaries sorted by series and obs_time.
         """
         if projections_data is None and staging_data is None:
             return []
@@ -193,62 +424,40 @@ class ProjectionMerger:
         if staging_data is None:
             return projections_data
 
-        # Combine both lists
-        combined = projections_data + staging_data
+        # Decorate each record with its key once; the source tag breaks
+        # ties so the projections side (0) always sorts ahead of the
+        # staging side (1) and dicts are never compared directly.
+        projections_decorated = sorted(
+            (self._merge_sort_key(item), 0, index, item)
+            for index, item in enumerate(projections_data)
+        )
+        staging_decorated = sorted(
+            (self._merge_sort_key(item), 1, index, item)
+            for index, item in enumerate(staging_data)
+        )
 
-        # Remove duplicates based on (obs_time, internal_series_code)
-        # Keep first occurrence (projections data takes precedence since it comes first)
-        seen = set()
         merged = []
-        for item in combined:
-            obs_time = item.get("obs_time")
-            internal_series_code = item.get("internal_series_code")
-            
-            # Convert obs_time to string for comparison if it's a datetime
-            if isinstance(obs_time, datetime):
-                obs_time_key = obs_time.isoformat()
-            else:
-                obs_time_key = str(obs_time) if obs_time else None
-            
-            key = (obs_time_key, str(internal_series_code) if internal_series_code else None)
-            if key not in seen:
-                seen.add(key)
-                merged.append(item)
+        previous_key = None
+        for key, _source, _index, item in heapq.merge(projections_decorated, staging_decorated):
+            if key == previous_key:
+                continue
+            merged.append(item)
+            previous_key = key
 
         return merged
 
     def _write_json(self, data: List[Dict[str, Any]], output_file: Path) -> None:
         """Write data to JSON file.
 
+        orjson serializes datetimes to ISO strings natively and emits
+        compact UTF-8 bytes; the output is machine-consumed, so no
+        indentation is added.
+
         Args:
             data: List of data dictionaries to write.
             output_file: Output file path.
         """
-        # Convert datetime objects to ISO format strings for JSON serialization
-        json_data = self._serialize_datetimes(data)
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-
-    def _serialize_datetimes(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Serialize datetime objects to ISO format strings for JSON.
-
-        Args:
-            data: List of data dictionaries.
-
-        Returns:
-            List with datetime objects converted to ISO strings.
-        """
-        serialized = []
-        for item in data:
-            serialized_item = {}
-            for key, value in item.items():
-                if isinstance(value, datetime):
-                    serialized_item[key] = value.isoformat()
-                else:
-                    serialized_item[key] = value
-            serialized.append(serialized_item)
-        return serialized
+        output_file.write_bytes(orjson.dumps(data))
 
     def _upload_to_staging(self, s3_key: str, local_file: Path) -> None:
         """Upload file to staging in S3.
@@ -257,4 +466,6 @@ class ProjectionMerger:
             s3_key: S3 destination key.
             local_file: Local file path.
         """
-        self._s3_client.upload_file(str(local_file), self._bucket, s3_key)
+        self._s3_client.upload_file(
+            str(local_file), self._bucket, s3_key, Config=_UPLOAD_TRANSFER_CONFIG
+        )
@@ -2,7 +2,7 @@
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, List, Set
+from typing import Any, List, Optional, Set
 
 from botocore.exceptions import ClientError
 
@@ -10,6 +10,9 @@ from src.infrastructure.utils.aws_utils import create_s3_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of keys accepted by one DeleteObjects call.
+_DELETE_BATCH_SIZE = 1000
+
 
 class StagingManager:
     """Manages the staging area for projection operations."""
@@ -19,7 +22,7 @@ class StagingManager:
         bucket: str,
         s3_client: Any = None,
         aws_region: str = "us-east-1",
-        copy_workers: int = 1,
+        copy_workers: int = 32,
     ):
         """Initialize StagingManager.
 
@@ -27,14 +30,25 @@ class StagingManager:
             bucket: S3 bucket name.
             s3_client: Boto3 S3 client (optional, for testing).
             aws_region: AWS region (default: us-east-1).
-            copy_workers: Number of parallel workers for copying files (default: 1, sequential).
+            copy_workers: Number of parallel workers for copying files
+                (default: 32). copy_object is a server-side operation, so
+                the workers only hold request latency, not data transfer;
+                pass 1 for sequential behavior.
         """
         self._bucket = bucket
-        self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
+        # Size the connection pool to the worker count so parallel copies
+        # and deletes get concurrent sockets instead of queueing on the
+        # default pool of 10. Injected clients should be configured
+        # similarly by their owners.
+        self._s3_client = create_s3_client(
+            aws_region=aws_region,
+            s3_client=s3_client,
+            max_pool_connections=max(10, copy_workers * 2),
+        )
         self._copy_workers = copy_workers
 
     def copy_from_version(
-        self, version_id: str, dataset_id: str, json_files: List[str]
+        self, version_id: str, dataset_id: str, json_files: List[str], idempotent: bool = True
     ) -> List[str]:
         """Copy JSON files from a version to staging.
 
@@ -42,6 +56,9 @@ class StagingManager:
             version_id: Version identifier.
             dataset_id: Dataset identifier.
             json_files: List of relative JSON file paths.
+            idempotent: Skip files whose staging copy already matches the
+                source ETag (default: True), so re-runs avoid rewriting
+                unchanged objects.
 
         Returns:
             List of staging paths where files were copied.
@@ -51,12 +68,12 @@ class StagingManager:
             return []
 
         self._log_copy_start(version_id, dataset_id, len(json_files))
-        staging_paths = self._copy_all_files(version_id, dataset_id, json_files)
+        staging_paths = self._copy_all_files(version_id, dataset_id, json_files, idempotent)
         self._log_copy_complete(len(staging_paths))
         return staging_paths
 
     def _copy_all_files(
-        self, version_id: str, dataset_id: str, json_files: List[str]
+        self, version_id: str, dataset_id: str, json_files: List[str], idempotent: bool
     ) -> List[str]:
         """Copy all files from version to staging.
 
@@ -64,14 +81,15 @@ class StagingManager:
             version_id: Version identifier.
             dataset_id: Dataset identifier.
             json_files: List of relative JSON file paths.
+            idempotent: Skip files already matching the source ETag.
 
         Returns:
             List of staging paths where files were copied.
         """
-        return self._copy_all_files_parallel(version_id, dataset_id, json_files)
+        return self._copy_all_files_parallel(version_id, dataset_id, json_files, idempotent)
 
     def _copy_all_files_parallel(
-        self, version_id: str, dataset_id: str, json_files: List[str]
+        self, version_id: str, dataset_id: str, json_files: List[str], idempotent: bool
     ) -> List[str]:
         """Copy all files in parallel using ThreadPoolExecutor."""
         total_files = len(json_files)
@@ -84,6 +102,9 @@ class StagingManager:
             """Copy a single file and return destination key."""
             source_key = self._build_version_file_path(dataset_id, version_id, json_file)
             dest_key = self._build_staging_file_path(dataset_id, json_file)
+            if idempotent and self._etags_match(source_key, dest_key):
+                logger.debug("Skipping unchanged file: %s", dest_key)
+                return dest_key
             self._log_file_copy(source_key, dest_key)
             self._copy_s3_object(source_key, dest_key)
             return dest_key
@@ -143,7 +164,7 @@ class StagingManager:
         logger.debug("Listing staging partitions for dataset %s", dataset_id)
 
         staging_prefix = self._build_staging_prefix(dataset_id)
-        s3_keys = self._list_s3_keys(staging_prefix)
+        s3_keys = self._list_staging_keys(staging_prefix)
 
         if not s3_keys:
             logger.debug("No files found in staging for dataset %s", dataset_id)
@@ -173,17 +194,55 @@ class StagingManager:
         logger.info("Cleared %d file(s) from staging", len(s3_keys))
 
     def _delete_all_objects(self, s3_keys: List[str]) -> None:
-        """Delete all S3 objects.
+        """Delete all S3 objects in DeleteObjects batches.
+
+        One batch call removes up to 1000 keys, collapsing the per-key
+        round trips a delete_object loop would pay.
 
         Args:
             s3_keys: List of S3 object keys to delete.
         """
         total_files = len(s3_keys)
-        for idx, key in enumerate(s3_keys, start=1):
-            if idx % 100 == 0 or idx == total_files:
-                logger.info("Deleting progress: %d/%d files (%.1f%%)", idx, total_files, (idx / total_files) * 100)
-            logger.debug("Deleting: %s", key)
-            self._delete_s3_object(key)
+        batches = [
+            s3_keys[batch_start : batch_start + _DELETE_BATCH_SIZE]
+            for batch_start in range(0, total_files, _DELETE_BATCH_SIZE)
+        ]
+
+        if self._copy_workers <= 1 or len(batches) == 1:
+            deleted = 0
+            for batch in batches:
+                self._delete_s3_objects_batch(batch)
+                deleted += len(batch)
+                self._log_delete_progress(deleted, total_files)
+            return
+
+        # Batches are independent, so fan them out on the same worker
+        # budget copy_from_version uses.
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=self._copy_workers) as executor:
+            future_to_batch = {
+                executor.submit(self._delete_s3_objects_batch, batch): batch
+                for batch in batches
+            }
+
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Failed to delete batch of %d key(s): %s", len(batch), e)
+                    raise
+                deleted += len(batch)
+                self._log_delete_progress(deleted, total_files)
+
+    def _log_delete_progress(self, deleted: int, total_files: int) -> None:
+        """Log deletion progress after each completed batch."""
+        logger.info(
+            "Deleting progress: %d/%d files (%.1f%%)",
+            deleted,
+            total_files,
+            (deleted / total_files) * 100,
+        )
 
     def _build_version_file_path(self, dataset_id: str, version_id: str, json_file: str) -> str:
         """Build S3 key path for a file in a version.
@@ -234,33 +293,121 @@ class StagingManager:
             Key=dest_key,
         )
 
-    def _list_s3_keys(self, prefix: str) -> List[str]:
-        """List all S3 object keys with the given prefix, handling pagination.
+    def _etags_match(self, source_key: str, dest_key: str) -> bool:
+        """Check whether the staging copy already matches the source object.
+
+        The destination is probed first so the common first-copy case
+        (no staging object yet) costs a single HeadObject; only when a
+        staging object exists is the source ETag fetched for comparison.
 
         Args:
-            prefix: S3 key prefix.
+            source_key: Source S3 key.
+            dest_key: Destination S3 key in staging.
+
+        Returns:
+            True if both objects exist with the same ETag.
+        """
+        dest_etag = self._get_object_etag(dest_key)
+        if dest_etag is None:
+            return False
+        return dest_etag == self._get_object_etag(source_key)
+
+    def _get_object_etag(self, key: str) -> Optional[str]:
+        """Get the ETag of an S3 object, or None if it does not exist.
+
+        Args:
+            key: S3 object key.
+
+        Returns:
+            ETag string, or None for a missing object.
+        """
+        try:
+            response = self._s3_client.head_object(Bucket=self._bucket, Key=key)
+            return response.get("ETag")
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    def _list_staging_keys(self, staging_prefix: str) -> List[str]:
+        """List staging keys, fanning out per series prefix when parallel.
+
+        Sequential pagination is serialized by continuation tokens; with
+        multiple workers and multiple top-level series prefixes the
+        per-series listings run concurrently instead.
+
+        Args:
+            staging_prefix: Staging area prefix for the dataset.
 
         Returns:
             List of S3 object keys.
         """
-        all_keys = []
-        continuation_token = None
+        if self._copy_workers > 1:
+            series_prefixes = self._list_top_level_prefixes(staging_prefix)
+            if len(series_prefixes) > 1:
+                return self._list_s3_keys_fanout(series_prefixes)
+        return self._list_s3_keys(staging_prefix)
+
+    def _list_top_level_prefixes(self, prefix: str) -> List[str]:
+        """List the immediate child prefixes under a prefix.
 
+        Args:
+            prefix: S3 key prefix.
+
+        Returns:
+            List of common prefixes one path segment below the prefix.
+        """
         try:
-            while True:
-                params = {"Bucket": self._bucket, "Prefix": prefix}
-                if continuation_token:
-                    params["ContinuationToken"] = continuation_token
+            paginator = self._s3_client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
+                Bucket=self._bucket, Prefix=prefix, Delimiter="/"
+            )
+            return [
+                common_prefix["Prefix"]
+                for page in pages
+                for common_prefix in page.get("CommonPrefixes", [])
+            ]
+        except ClientError as e:
+            if self._is_nosuchkey_error(e):
+                return []
+            raise
 
-                response = self._s3_client.list_objects_v2(**params)
-                keys = self._extract_keys_from_response(response)
+    def _list_s3_keys_fanout(self, prefixes: List[str]) -> List[str]:
+        """List keys under several prefixes in parallel.
+
+        Args:
+            prefixes: S3 key prefixes to list concurrently.
+
+        Returns:
+            Combined list of S3 object keys.
+        """
+        all_keys: List[str] = []
+        workers = min(self._copy_workers, len(prefixes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for keys in executor.map(self._list_s3_keys, prefixes):
                 all_keys.extend(keys)
+        return all_keys
 
-                if not response.get("IsTruncated", False):
-                    break
+    def _list_s3_keys(self, prefix: str) -> List[str]:
+        """List all S3 object keys with the given prefix, handling pagination.
+
+        Args:
+            prefix: S3 key prefix.
 
-                continuation_token = response.get("NextContinuationToken")
+        Returns:
+            List of S3 object keys.
+        """
+        all_keys: List[str] = []
 
+        try:
+            paginator = self._s3_client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
+                Bucket=self._bucket,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+            for page in pages:
+                all_keys.extend(self._extract_keys_from_response(page))
             return all_keys
         except ClientError as e:
             if self._is_nosuchkey_error(e):
@@ -306,46 +453,43 @@ class StagingManager:
             Prefix: datasets/test/staging/
             Result: SERIES_1/year=2024/month=01
         """
+        # S3 already guarantees every listed key starts with the requested
+        # prefix, so a slice plus rsplit per key is all that's needed.
+        prefix_len = len(prefix)
         partitions = set()
         for key in s3_keys:
-            partition_path = self._extract_partition_from_key(key, prefix)
-            if partition_path:
-                partitions.add(partition_path)
+            relative_path = key[prefix_len:]
+            separator_index = relative_path.rfind("/")
+            if separator_index > 0:
+                partitions.add(relative_path[:separator_index])
         return partitions
 
-    def _extract_partition_from_key(self, s3_key: str, prefix: str) -> str:
-        """Extract partition path from a single S3 key.
-
-        Args:
-            s3_key: Full S3 key.
-            prefix: Prefix to remove.
-
-        Returns:
-            Partition path (empty string if extraction fails).
-        """
-        if not s3_key.startswith(prefix):
-            return ""
-
-        relative_path = s3_key[len(prefix) :]
-        return self._get_partition_path_from_relative(relative_path)
+    def _delete_s3_objects_batch(self, keys: List[str]) -> None:
+        """Delete a batch of S3 objects with one DeleteObjects call.
 
-    def _get_partition_path_from_relative(self, relative_path: str) -> str:
-        """Get partition path from relative file path.
+        Quiet mode reports per-key failures in the response's Errors list
+        instead of raising, so the response is checked here; otherwise a
+        partially failed batch would be logged as a successful clear.
 
         Args:
-            relative_path: Relative path (e.g., "SERIES_1/year=2024/month=01/data.json").
+            keys: S3 object keys to delete (at most 1000).
 
-        Returns:
-            Partition path without filename (e.g., "SERIES_1/year=2024/month=01").
+        Raises:
+            RuntimeError: If any key in the batch failed to delete.
         """
-        path_parts = relative_path.split("/")
-        partition_parts = path_parts[:-1]  # Remove filename (last part)
-        return "/".join(partition_parts)
-
-    def _delete_s3_object(self, key: str) -> None:
-        """Delete an S3 object.
-
-        Args:
-            key: S3 object key to delete.
-        """
-        self._s3_client.delete_object(Bucket=self._bucket, Key=key)
+        response = self._s3_client.delete_objects(
+            Bucket=self._bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors")
+        if errors:
+            for error in errors:
+                logger.error(
+                    "Failed to delete %s: %s (%s)",
+                    error.get("Key"),
+                    error.get("Message"),
+                    error.get("Code"),
+                )
+            raise RuntimeError(
+                f"Failed to delete {len(errors)} of {len(keys)} staging object(s)"
+            )
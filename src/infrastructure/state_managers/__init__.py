@@ -1,6 +1,7 @@
 """State manager implementations."""
 
 from src.infrastructure.state_managers.file_state_manager import FileStateManager
+from src.infrastructure.state_managers.memory_state_manager import MemoryStateManager
 from src.infrastructure.state_managers.state_manager_factory import StateManagerFactory
 
 # Alias for backward compatibility
@@ -8,6 +9,7 @@ StateManager = FileStateManager
 
 __all__ = [
     "FileStateManager",
+    "MemoryStateManager",
     "StateManager",
     "StateManagerFactory",
 ]
@@ -1,12 +1,14 @@
 """File-based state manager for incremental updates."""
 
-import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from src.domain.interfaces import StateManager as StateManagerInterface
-from src.infrastructure.utils.date_utils import to_naive
+from src.infrastructure.utils.date_utils import compute_series_max_dates, to_naive
 
 
 class FileStateManager(StateManagerInterface):
@@ -19,72 +21,83 @@ class FileStateManager(StateManagerInterface):
             state_file: Path to state file.
         """
         self._state_file = Path(state_file)
+        self._last_serialized: Optional[bytes] = None
 
     def get_series_last_dates(self, config: Dict[str, Any]) -> Dict[str, datetime]:
-        """Get last processed date for each series in config."""
+        """Get last processed date for each series in config.
+
+        Loads the state file once and resolves every series against the
+        in-memory dict, instead of re-reading the file per series.
+        """
         parse_config = config.get("parse_config", {})
         series_map = parse_config.get("series_map", [])
-        
+
+        state = self._load()
         series_last_dates = {}
         for series_config in series_map:
             series_code = str(series_config.get("internal_series_code", ""))
             if series_code:
-                last_date = self.get_last_date(series_code)
+                last_date = self._parse_date(state.get(series_code))
                 if last_date:
                     series_last_dates[series_code] = last_date
-        
+
         return series_last_dates
 
     def save_dates_from_data(self, data: List[Dict[str, Any]]) -> None:
         """Save max date for each series from normalized data."""
         if not data:
             return
-        
-        series_max_dates: Dict[str, datetime] = {}
-        for data_point in data:
-            series_code = data_point.get("internal_series_code")
-            obs_time = data_point.get("obs_time")
-            
-            if series_code and isinstance(obs_time, datetime):
-                series_code = str(series_code)
-                obs_time_naive = to_naive(obs_time)
-                if obs_time_naive and (series_code not in series_max_dates or obs_time_naive > series_max_dates[series_code]):
-                    series_max_dates[series_code] = obs_time_naive
-        
+
+        series_max_dates = compute_series_max_dates(data)
+
         if series_max_dates:
             state = self._load()
-            for series_code, max_date in series_max_dates.items():
-                state[series_code] = max_date.isoformat()
+            # orjson serializes datetimes as ISO strings natively
+            state.update(series_max_dates)
             self._save(state)
 
     def get_last_date(self, series_code: str) -> Optional[datetime]:
         """Get last processed date for a series (always naive)."""
         state = self._load()
-        date_str = state.get(series_code)
+        return self._parse_date(state.get(series_code))
+
+    @staticmethod
+    def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
+        """Parse a stored ISO date string to a naive datetime."""
         if not date_str:
             return None
-        
+
         date = datetime.fromisoformat(date_str)
         return to_naive(date)
 
-    def _load(self) -> Dict[str, str]:
+    def _load(self) -> Dict[str, Any]:
         """Load state from file."""
         if not self._state_file.exists():
             return {}
         try:
-            with open(self._state_file, encoding="utf-8") as f:
-                content = f.read().strip()
-                if not content:
-                    return {}
-                return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            content = self._state_file.read_bytes().strip()
+            if not content:
+                return {}
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {}
 
-    def _save(self, state: Dict[str, str]) -> None:
-        """Save state to file."""
+    def _save(self, state: Dict[str, Any]) -> None:
+        """Save state to file atomically, skipping unchanged writes.
+
+        The serialized bytes are compared against the previous write so
+        repeated saves of identical state cost nothing, and the file is
+        replaced via a temp file so readers never see truncated JSON.
+        """
+        blob = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        if blob == self._last_serialized:
+            return
+
         self._state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        tmp_file = self._state_file.with_name(self._state_file.name + ".tmp")
+        tmp_file.write_bytes(blob)
+        os.replace(tmp_file, self._state_file)
+        self._last_serialized = blob
 
 
 # Alias for backward compatibility
@@ -8,6 +8,7 @@ class StateManagerKind(str, Enum):
 
     FILE = "file"
     S3 = "s3"
+    MEMORY = "memory"
 
 
 class LockManagerKind(str, Enum):
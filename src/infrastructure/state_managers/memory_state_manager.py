@@ -0,0 +1,41 @@
+"""In-memory state manager for incremental updates."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.domain.interfaces import StateManager as StateManagerInterface
+from src.infrastructure.utils.date_utils import compute_series_max_dates
+
+
+class MemoryStateManager(StateManagerInterface):
+    """In-memory state manager for incremental updates.
+
+    Keeps per-series last dates in a plain dict with no persistence.
+    Useful for tests and ephemeral runs where state should not survive
+    the process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize in-memory state manager."""
+        self._state: Dict[str, datetime] = {}
+
+    def get_series_last_dates(self, config: Dict[str, Any]) -> Dict[str, datetime]:
+        """Get last processed date for each series in config."""
+        parse_config = config.get("parse_config", {})
+        series_map = parse_config.get("series_map", [])
+
+        series_last_dates = {}
+        for series_config in series_map:
+            series_code = str(series_config.get("internal_series_code", ""))
+            if series_code and series_code in self._state:
+                series_last_dates[series_code] = self._state[series_code]
+
+        return series_last_dates
+
+    def save_dates_from_data(self, data: List[Dict[str, Any]]) -> None:
+        """Save max date for each series from normalized data."""
+        self._state.update(compute_series_max_dates(data))
+
+    def get_last_date(self, series_code: str) -> Optional[datetime]:
+        """Get last processed date for a series (always naive)."""
+        return self._state.get(series_code)
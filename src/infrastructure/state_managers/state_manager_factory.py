@@ -1,18 +1,54 @@
 """Factory for creating StateManager instances."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from src.domain.interfaces import StateManager as StateManagerInterface
 from src.infrastructure.state_managers.file_state_manager import FileStateManager
 from src.infrastructure.state_managers.manager_kinds import StateManagerKind
+from src.infrastructure.state_managers.memory_state_manager import MemoryStateManager
 from src.infrastructure.state_managers.s3_state_manager import S3StateManager
 
 
+def _build_file_manager(state_config: Dict[str, Any]) -> FileStateManager:
+    """Build a file-based state manager from config."""
+    return FileStateManager(state_config.get("state_file", "state.json"))
+
+
+def _build_s3_manager(state_config: Dict[str, Any]) -> S3StateManager:
+    """Build an S3-based state manager from config."""
+    bucket = state_config.get("bucket")
+    key = state_config.get("key")
+    if not bucket or not key:
+        raise ValueError("S3 state manager requires 'bucket' and 'key' in config")
+    return S3StateManager(
+        bucket=bucket,
+        key=key,
+        aws_access_key_id=state_config.get("aws_access_key_id"),
+        aws_secret_access_key=state_config.get("aws_secret_access_key"),
+        aws_region=state_config.get("aws_region", "us-east-1"),
+    )
+
+
+def _build_memory_manager(state_config: Dict[str, Any]) -> MemoryStateManager:
+    """Build an in-memory state manager from config."""
+    return MemoryStateManager()
+
+
 class StateManagerFactory:
     """Factory for creating StateManager instances based on configuration."""
 
-    @staticmethod
-    def create(state_config: Optional[Dict[str, Any]] = None) -> Optional[StateManagerInterface]:
+    # Kind-to-builder registry; new backends register here instead of
+    # growing a dispatch chain in create().
+    _REGISTRY: Dict[StateManagerKind, Callable[[Dict[str, Any]], StateManagerInterface]] = {
+        StateManagerKind.FILE: _build_file_manager,
+        StateManagerKind.S3: _build_s3_manager,
+        StateManagerKind.MEMORY: _build_memory_manager,
+    }
+
+    @classmethod
+    def create(
+        cls, state_config: Optional[Dict[str, Any]] = None
+    ) -> Optional[StateManagerInterface]:
         """Create StateManager instance from configuration.
 
         Args:
@@ -20,6 +56,7 @@ class StateManagerFactory:
                 Examples:
                 - {"kind": "file", "state_file": "state.json"}
                 - {"kind": "s3", "bucket": "my-bucket", "key": "state.json"}
+                - {"kind": "memory"}
                 - None: Returns None (no state manager)
 
         Returns:
@@ -34,22 +71,4 @@ class StateManagerFactory:
         except ValueError as exc:
             raise ValueError(f"Unknown state manager kind: {kind_str}") from exc
 
-        if kind == StateManagerKind.FILE:
-            state_file = state_config.get("state_file", "state.json")
-            return FileStateManager(state_file)
-
-        elif kind == StateManagerKind.S3:
-            bucket = state_config.get("bucket")
-            key = state_config.get("key")
-            if not bucket or not key:
-                raise ValueError("S3 state manager requires 'bucket' and 'key' in config")
-            return S3StateManager(
-                bucket=bucket,
-                key=key,
-                aws_access_key_id=state_config.get("aws_access_key_id"),
-                aws_secret_access_key=state_config.get("aws_secret_access_key"),
-                aws_region=state_config.get("aws_region", "us-east-1"),
-            )
-
-        # This should never happen with proper enum usage, but kept for defensive programming
-        raise ValueError(f"Unhandled state manager kind: {kind}")  # pragma: no cover
+        return cls._REGISTRY[kind](state_config)
@@ -4,10 +4,13 @@ import os
 from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 
 
 def create_s3_client(
-    aws_region: str = "us-east-1", s3_client: Optional[Any] = None
+    aws_region: str = "us-east-1",
+    s3_client: Optional[Any] = None,
+    max_pool_connections: Optional[int] = None,
 ) -> Any:
     """Create an S3 client with explicit credentials.
 
@@ -17,6 +20,9 @@ def create_s3_client(
     Args:
         aws_region: AWS region (default: us-east-1).
         s3_client: Existing S3 client to use (for testing).
+        max_pool_connections: Size of the urllib3 connection pool (optional).
+            Set this when the client is shared across concurrent workers so
+            requests don't queue behind the default pool size.
 
     Returns:
         Boto3 S3 client instance.
@@ -33,5 +39,8 @@ def create_s3_client(
         client_kwargs["aws_access_key_id"] = aws_access_key_id
         client_kwargs["aws_secret_access_key"] = aws_secret_access_key
 
+    if max_pool_connections is not None:
+        client_kwargs["config"] = Config(max_pool_connections=max_pool_connections)
+
     return boto3.client("s3", **client_kwargs)
 
@@ -1,7 +1,12 @@
 """Date utility functions."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+# Above this row count the per-series max moves to a pandas groupby.
+_VECTORIZE_THRESHOLD = 1000
 
 
 def to_naive(date: Optional[datetime]) -> Optional[datetime]:
@@ -18,6 +23,64 @@ def to_naive(date: Optional[datetime]) -> Optional[datetime]:
     return date.replace(tzinfo=None) if date.tzinfo else date
 
 
+def compute_series_max_dates(data: List[Dict[str, Any]]) -> Dict[str, datetime]:
+    """Compute the max naive obs_time per series code.
+
+    Entries without a truthy series code or a datetime obs_time are
+    ignored. Large batches run the reduction as a pandas groupby-max in
+    C; small ones keep the plain dict loop.
+
+    Args:
+        data: Normalized data points with internal_series_code and obs_time.
+
+    Returns:
+        Mapping of series code to its latest naive observation time.
+    """
+    if len(data) > _VECTORIZE_THRESHOLD:
+        return _compute_series_max_dates_vectorized(data)
+    return _compute_series_max_dates_loop(data)
+
+
+def _compute_series_max_dates_loop(data: List[Dict[str, Any]]) -> Dict[str, datetime]:
+    """Dict-loop reduction used for small batches."""
+    series_max_dates: Dict[str, datetime] = {}
+    for data_point in data:
+        series_code = data_point.get("internal_series_code")
+        obs_time = data_point.get("obs_time")
+
+        if series_code and isinstance(obs_time, datetime):
+            series_code = str(series_code)
+            obs_time_naive = to_naive(obs_time)
+            if obs_time_naive and (
+                series_code not in series_max_dates
+                or obs_time_naive > series_max_dates[series_code]
+            ):
+                series_max_dates[series_code] = obs_time_naive
+
+    return series_max_dates
+
+
+def _compute_series_max_dates_vectorized(data: List[Dict[str, Any]]) -> Dict[str, datetime]:
+    """pandas groupby-max reduction used for large batches."""
+    obs_times = []
+    for data_point in data:
+        obs_time = data_point.get("obs_time")
+        obs_times.append(to_naive(obs_time) if isinstance(obs_time, datetime) else None)
+
+    df = pd.DataFrame(
+        {
+            "series_code": [dp.get("internal_series_code") for dp in data],
+            "obs_time": obs_times,
+        }
+    )
+    df = df[df["series_code"].astype(bool) & df["obs_time"].notna()]
+    if df.empty:
+        return {}
+
+    grouped = df.groupby(df["series_code"].astype(str))["obs_time"].max()
+    return {code: ts.to_pydatetime() for code, ts in grouped.items()}
+
+
 def get_window_start_date(window_in_days: Optional[int]) -> Optional[datetime]:
     """Calculate the start date of a time window.
     
@@ -1,15 +1,22 @@
 """Excel utility functions for parsers."""
 
+import functools
 
+# Maps ASCII letters (either case) to their 1-based alphabet position in
+# one C-level pass; every other byte decodes to 0.
+_COLUMN_TABLE = bytes((b & 0x1F) if 0x41 <= (b & 0xDF) <= 0x5A else 0 for b in range(256))
+
+
+@functools.lru_cache(maxsize=None)
 def excel_column_to_index(column: str) -> int:
     """Convert Excel column letter(s) to 0-based index.
-    
+
     Args:
         column: Excel column letter(s) (e.g., 'A', 'Z', 'AA').
-        
+
     Returns:
         0-based column index.
-        
+
     Examples:
         >>> excel_column_to_index('A')
         0
@@ -20,8 +27,9 @@ def excel_column_to_index(column: str) -> int:
         >>> excel_column_to_index('AD')
         29
     """
+    digits = column.encode("ascii").translate(_COLUMN_TABLE)
     index = 0
-    for char in column:
-        index = index * 26 + (ord(char.upper()) - ord('A') + 1)
+    for digit in digits:
+        index = index * 26 + digit
     return index - 1
 
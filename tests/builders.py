@@ -1,5 +1,6 @@
 """Test builders for creating test objects."""
 
+import hashlib
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from unittest.mock import Mock
@@ -166,6 +167,28 @@ class ETLUseCaseBuilder:
         return lock_manager
 
 
+class CachingParser:
+    """Parser wrapper that memoizes parse results for identical inputs.
+
+    Parsing is deterministic, so integration tests that run the same
+    payload repeatedly reuse the first result instead of re-decoding the
+    workbook. Callers get copies so cached data stays immutable.
+    """
+
+    def __init__(self, parser):
+        """Initialize with the parser to wrap."""
+        self._parser = parser
+        self._cache: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def parse(self, raw_data, config, series_last_dates=None):
+        """Parse raw data, reusing cached results for identical inputs."""
+        digest = hashlib.blake2b(raw_data, digest_size=16).digest()
+        key = (digest, repr(config), repr(series_last_dates))
+        if key not in self._cache:
+            self._cache[key] = self._parser.parse(raw_data, config, series_last_dates)
+        return [item.copy() for item in self._cache[key]]
+
+
 class ConfigBuilder:
     """Builder for ETL configuration dictionaries."""
 
@@ -296,6 +319,11 @@ class StateManagerBuilder:
         self._state_config = {"kind": "file", "state_file": state_file}
         return self
 
+    def with_memory(self):
+        """Configure in-memory state manager."""
+        self._state_config = {"kind": "memory"}
+        return self
+
     def with_s3(
         self,
         bucket: str,
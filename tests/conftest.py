@@ -1,35 +1,57 @@
 """Pytest configuration and shared fixtures."""
 
+import base64
 import io
 from datetime import datetime
 
 import pytest
 from openpyxl import Workbook
 
+# Bump when the generated workbook changes so stale cache entries are ignored.
+_SAMPLE_EXCEL_CACHE_KEY = "ingestor_reader/sample_excel_bytes_v1"
 
-@pytest.fixture
-def sample_excel_bytes():
-    """Create a sample Excel file in memory for testing."""
+
+def _build_excel_bytes() -> bytes:
+    """Build the sample Excel workbook used across the suite."""
     wb = Workbook()
     ws = wb.active
     ws.title = "TEST_SHEET"
-    
+
     # Header row (row 1)
     ws["A1"] = "Date"
     ws["B1"] = "Value"
-    
+
     # Data rows (rows 2-11, 10 data points)
     for i in range(2, 12):
         ws[f"A{i}"] = datetime(2025, 1, i - 1)
         ws[f"B{i}"] = (i - 1) * 10.5
-    
+
     # Save to bytes
     excel_file = io.BytesIO()
     wb.save(excel_file)
-    excel_file.seek(0)
     return excel_file.getvalue()
 
 
+@pytest.fixture(scope="session")
+def sample_excel_bytes(request):
+    """Sample Excel file as immutable bytes, cached across test sessions.
+
+    Workbook serialization is dominated by zip compression, so the payload
+    is stored in pytest's cache and reused on warm runs.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:  # cacheprovider disabled (-p no:cacheprovider)
+        return _build_excel_bytes()
+
+    cached = cache.get(_SAMPLE_EXCEL_CACHE_KEY, None)
+    if cached:
+        return base64.b64decode(cached)
+
+    payload = _build_excel_bytes()
+    cache.set(_SAMPLE_EXCEL_CACHE_KEY, base64.b64encode(payload).decode())
+    return payload
+
+
 @pytest.fixture
 def sample_parser_config():
     """Sample parser configuration."""
@@ -61,4 +83,3 @@ def sample_normalizer_config():
             "primary_keys": ["obs_time", "internal_series_code"],
         }
     }
-
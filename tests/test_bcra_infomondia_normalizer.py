@@ -135,6 +135,29 @@ class TestBcraInfomondiaNormalizer:
         result = normalizer.normalize(data, config)
         assert len(result) == 2  # One duplicate removed
 
+    def test_normalize_deduplication_large_input(self, normalizer):
+        """Test deduplication over many rows with a high duplicate ratio."""
+        config = {
+            "normalize": {
+                "timezone": "UTC",
+                "primary_keys": ["obs_time", "internal_series_code"],
+            }
+        }
+
+        # 10k rows but only 1k unique (obs_time, series_code) pairs
+        data = [
+            {
+                "internal_series_code": "SERIES_1",
+                "obs_time": datetime(2025, 1, 1, minute=i % 60, second=i // 60 % 17),
+                "value": float(i),
+            }
+            for i in range(10_000)
+        ]
+        unique_keys = {(d["obs_time"], d["internal_series_code"]) for d in data}
+
+        result = normalizer.normalize(data, config)
+        assert len(result) == len(unique_keys)
+
     def test_normalize_no_deduplication(self, normalizer):
         """Test that deduplication is skipped when primary_keys not specified."""
         config = {
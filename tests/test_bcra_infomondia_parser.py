@@ -90,6 +90,20 @@ class TestBcraInfomondiaParser:
             if isinstance(obs_time, datetime):
                 assert obs_time > series_last_dates["TEST_SERIES"]
 
+    def test_filter_by_last_date_keeps_non_datetime_cells(self, parser):
+        """Test that string and header cells survive the incremental filter."""
+        dates = ["Date", "2025-01-03", datetime(2025, 1, 3), datetime(2025, 1, 10)]
+        values = ["Value", 1.0, 2.0, 3.0]
+
+        filtered_dates, filtered_values = parser._filter_by_last_date(  # noqa: SLF001
+            dates, values, datetime(2025, 1, 5)
+        )
+
+        # Only the real datetime at/before the cutoff is dropped; the ISO
+        # string is not a datetime and stays for the normalizer to handle
+        assert filtered_dates == ["Date", "2025-01-03", datetime(2025, 1, 10)]
+        assert filtered_values == ["Value", 1.0, 3.0]
+
     def test_parse_nonexistent_sheet(self, parser, sample_excel_bytes):
         """Test parsing with non-existent sheet."""
         config = {
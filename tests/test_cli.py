@@ -97,37 +97,33 @@ class TestHandleError:
 class TestRunETL:
     """Tests for run_etl function."""
 
-    @patch("src.cli._execute_etl_pipeline")
-    def test_run_etl_success(self, mock_execute):
-        """Test successful ETL execution."""
+    @pytest.fixture
+    def patched_cli(self):
+        """Patch the ETL pipeline and error handler once for all cases."""
+        with patch("src.cli._execute_etl_pipeline") as mock_execute, \
+                patch("src.cli._handle_error") as mock_handle:
+            yield mock_execute, mock_handle
+
+    @pytest.mark.parametrize(
+        "side_effect,handler_return,expected",
+        [
+            (None, None, 0),
+            (ValueError("Test error"), 1, 1),
+            (KeyboardInterrupt(), 130, 130),
+        ],
+        ids=["success", "error", "keyboard_interrupt"],
+    )
+    def test_run_etl(self, patched_cli, side_effect, handler_return, expected):
+        """Test run_etl exit codes for success, errors, and interrupts."""
+        mock_execute, mock_handle = patched_cli
         mock_execute.return_value = 0
-        
-        result = run_etl("test_dataset")
-        
-        assert result == 0
-        mock_execute.assert_called_once_with("test_dataset")
+        mock_execute.side_effect = side_effect
+        mock_handle.return_value = handler_return
 
-    @patch("src.cli._execute_etl_pipeline")
-    @patch("src.cli._handle_error")
-    def test_run_etl_handles_error(self, mock_handle, mock_execute):
-        """Test error handling in run_etl."""
-        mock_execute.side_effect = ValueError("Test error")
-        mock_handle.return_value = 1
-        
-        result = run_etl("test_dataset")
-        
-        assert result == 1
-        mock_handle.assert_called_once()
-
-    @patch("src.cli._execute_etl_pipeline")
-    @patch("src.cli._handle_error")
-    def test_run_etl_handles_keyboard_interrupt(self, mock_handle, mock_execute):
-        """Test KeyboardInterrupt handling."""
-        mock_execute.side_effect = KeyboardInterrupt()
-        mock_handle.return_value = 130
-        
         result = run_etl("test_dataset")
-        
-        assert result == 130
-        mock_handle.assert_called_once()
+
+        assert result == expected
+        mock_execute.assert_called_once_with("test_dataset")
+        if side_effect is not None:
+            mock_handle.assert_called_once()
 
@@ -2,12 +2,32 @@
 
 from unittest.mock import Mock, patch
 
-from src.infrastructure.lock_managers.dynamodb_lock_manager import DynamoDBLockManager
+import pytest
+from botocore.exceptions import ClientError
+
+from src.infrastructure.lock_managers.dynamodb_lock_manager import (
+    DynamoDBLockManager,
+    _shared_session,
+)
 
 
 class TestDynamoDBLockManager:
     """Tests for DynamoDBLockManager class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_session_cache(self):
+        """Keep the cached boto3 session from leaking between tests."""
+        _shared_session.cache_clear()
+        yield
+        _shared_session.cache_clear()
+
+    @staticmethod
+    def _mock_client(mock_boto3):
+        """Wire a mock DynamoDB client behind the session cache."""
+        mock_client = Mock()
+        mock_boto3.Session.return_value.client.return_value = mock_client
+        return mock_client
+
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_init_with_table_name(self, _mock_boto3):
         """Test initialization with table name."""
@@ -34,8 +54,7 @@ class TestDynamoDBLockManager:
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_acquire_success(self, mock_boto3):
         """Test successful lock acquisition."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        mock_client = self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(table_name="test_locks")
         result = manager.acquire("test_key", timeout_seconds=300)
@@ -48,11 +67,11 @@ class TestDynamoDBLockManager:
         assert "expiration_time" in call_kwargs[1]["Item"]
         assert "acquired_at" in call_kwargs[1]["Item"]
 
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.time.sleep")
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
-    def test_acquire_failure_already_locked(self, mock_boto3):
+    def test_acquire_failure_already_locked(self, mock_boto3, mock_sleep):
         """Test lock acquisition when already locked."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        mock_client = self._mock_client(mock_boto3)
 
         # Create exception class
         class ConditionalCheckFailedException(Exception):
@@ -70,38 +89,171 @@ class TestDynamoDBLockManager:
         result = manager.acquire("test_key", timeout_seconds=300)
 
         assert result is False
+        # Retries under contention: 5 attempts with backoff between them
+        assert mock_client.put_item.call_count == 5
+        assert mock_sleep.call_count == 4
+        # Jittered delays stay within the capped exponential schedule
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert all(0 <= delay <= 2.0 for delay in delays)
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.time.sleep")
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_acquire_retries_then_succeeds(self, mock_boto3, mock_sleep):
+        """Test lock acquisition succeeding after contention clears."""
+        mock_client = self._mock_client(mock_boto3)
+
+        # Create exception class
+        class ConditionalCheckFailedException(Exception):
+            pass
+
+        mock_exceptions = Mock()
+        mock_exceptions.ConditionalCheckFailedException = ConditionalCheckFailedException
+        mock_client.exceptions = mock_exceptions
+
+        # Locked for the first two attempts, then free
+        mock_client.put_item.side_effect = [
+            ConditionalCheckFailedException(),
+            ConditionalCheckFailedException(),
+            {},
+        ]
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        result = manager.acquire("test_key", timeout_seconds=300)
+
+        assert result is True
+        assert mock_client.put_item.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_acquire_many_success(self, mock_boto3):
+        """Test atomically acquiring multiple locks."""
+        mock_client = self._mock_client(mock_boto3)
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        result = manager.acquire_many(["key_a", "key_b"], timeout_seconds=300)
+
+        assert result == {"key_a": True, "key_b": True}
+        mock_client.transact_write_items.assert_called_once()
+        items = mock_client.transact_write_items.call_args[1]["TransactItems"]
+        assert len(items) == 2
+        assert items[0]["Put"]["TableName"] == "test_locks"
+        assert items[0]["Put"]["Item"]["lock_key"]["S"] == "key_a"
+        assert "expiration_time" in items[0]["Put"]["Item"]
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_acquire_many_cancelled_acquires_nothing(self, mock_boto3):
+        """Test that a cancelled transaction acquires no locks."""
+        mock_client = self._mock_client(mock_boto3)
+
+        # Create exception class carrying cancellation reasons
+        class TransactionCanceledException(Exception):
+            response = {
+                "CancellationReasons": [
+                    {"Code": "None"},
+                    {"Code": "ConditionalCheckFailed"},
+                ]
+            }
+
+        mock_exceptions = Mock()
+        mock_exceptions.TransactionCanceledException = TransactionCanceledException
+        mock_client.exceptions = mock_exceptions
+        mock_client.transact_write_items.side_effect = TransactionCanceledException()
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        result = manager.acquire_many(["key_a", "key_b"], timeout_seconds=300)
+
+        assert result == {"key_a": False, "key_b": False}
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_acquire_many_too_many_keys_raises(self, mock_boto3):
+        """Test that acquiring more than 25 locks at once is rejected."""
+        self._mock_client(mock_boto3)
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        with pytest.raises(ValueError, match="more than 25 locks"):
+            manager.acquire_many([f"key_{i}" for i in range(26)])
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_is_locked_uses_consistent_read(self, mock_boto3):
+        """Test that is_locked issues a strongly consistent GetItem by default."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.get_item.return_value = {
+            "Item": {
+                "lock_key": {"S": "test_key"},
+                "expiration_time": {"N": str(2**33)},
+            }
+        }
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        result = manager.is_locked("test_key")
+
+        assert result is True
+        call_kwargs = mock_client.get_item.call_args[1]
+        assert call_kwargs["TableName"] == "test_locks"
+        assert call_kwargs["ConsistentRead"] is True
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_is_locked_respects_consistent_read_flag(self, mock_boto3):
+        """Test that consistent_read=False propagates to GetItem."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.get_item.return_value = {}
+
+        manager = DynamoDBLockManager(table_name="test_locks", consistent_read=False)
+        result = manager.is_locked("test_key")
+
+        assert result is False
+        assert mock_client.get_item.call_args[1]["ConsistentRead"] is False
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_is_locked_expired_lock_is_free(self, mock_boto3):
+        """Test that an expired lock row reads as unlocked."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.get_item.return_value = {
+            "Item": {
+                "lock_key": {"S": "test_key"},
+                "expiration_time": {"N": "1"},
+            }
+        }
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+
+        assert manager.is_locked("test_key") is False
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_release_success(self, mock_boto3):
         """Test successful lock release."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        mock_client = self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(table_name="test_locks")
         manager.release("test_key")
 
-        mock_client.delete_item.assert_called_once()
-        call_kwargs = mock_client.delete_item.call_args
+        mock_client.update_item.assert_called_once()
+        call_kwargs = mock_client.update_item.call_args
         assert call_kwargs[1]["TableName"] == "test_locks"
         assert call_kwargs[1]["Key"]["lock_key"]["S"] == "test_key"
+        assert call_kwargs[1]["ConditionExpression"] == "attribute_exists(lock_key)"
+        # The lock is marked expired so a later acquire() sees it as free
+        assert "expiration_time" in call_kwargs[1]["UpdateExpression"]
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
-    def test_release_table_not_found(self, mock_boto3):
-        """Test lock release when table doesn't exist."""
-
-        # Create exception class
-        class ResourceNotFoundException(Exception):
-            pass
+    def test_release_missing_lock(self, mock_boto3):
+        """Test lock release when the lock row no longer exists."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
 
-        # Create a simple object with the exception as attribute using type()
-        exceptions_ns = type(
-            "exceptions", (), {"ResourceNotFoundException": ResourceNotFoundException}
-        )()
+        manager = DynamoDBLockManager(table_name="test_locks")
+        # Should not raise, should handle gracefully
+        manager.release("test_key")
 
-        mock_client = Mock()
-        mock_client.exceptions = exceptions_ns
-        mock_client.delete_item.side_effect = ResourceNotFoundException()
-        mock_boto3.client.return_value = mock_client
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_release_table_not_found(self, mock_boto3):
+        """Test lock release when table doesn't exist."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException"}}, "UpdateItem"
+        )
 
         manager = DynamoDBLockManager(table_name="test_locks")
         # Should not raise, should handle gracefully
@@ -110,42 +262,106 @@ class TestDynamoDBLockManager:
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_release_client_error(self, mock_boto3):
         """Test lock release when client error occurs."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException"}}, "UpdateItem"
+        )
 
-        # Create exception class
-        class ClientError(Exception):
-            pass
+        manager = DynamoDBLockManager(table_name="test_locks")
+        # Should not raise, should handle gracefully
+        manager.release("test_key")
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_release_many_batches_in_25s(self, mock_boto3):
+        """Test that release_many chunks deletions into batches of 25."""
+        mock_client = self._mock_client(mock_boto3)
+        mock_client.batch_write_item.return_value = {}
 
-        # Create a simple object with the exception as attribute using type()
-        exceptions_ns = type("exceptions", (), {"ClientError": ClientError})()
+        manager = DynamoDBLockManager(table_name="test_locks")
+        manager.release_many([f"key_{i}" for i in range(60)])
+
+        assert mock_client.batch_write_item.call_count == 3
+        batch_sizes = [
+            len(call[1]["RequestItems"]["test_locks"])
+            for call in mock_client.batch_write_item.call_args_list
+        ]
+        assert batch_sizes == [25, 25, 10]
+        first_request = mock_client.batch_write_item.call_args_list[0][1]
+        first_delete = first_request["RequestItems"]["test_locks"][0]
+        assert first_delete["DeleteRequest"]["Key"]["lock_key"]["S"] == "key_0"
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.time.sleep")
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_release_many_retries_unprocessed(self, mock_boto3, mock_sleep):
+        """Test that release_many retries UnprocessedItems with backoff."""
+        mock_client = self._mock_client(mock_boto3)
+        unprocessed = {
+            "test_locks": [
+                {"DeleteRequest": {"Key": {"lock_key": {"S": "key_0"}}}}
+            ]
+        }
+        mock_client.batch_write_item.side_effect = [
+            {"UnprocessedItems": unprocessed},
+            {},
+        ]
 
-        mock_client = Mock()
-        mock_client.exceptions = exceptions_ns
-        mock_client.delete_item.side_effect = ClientError()
-        mock_boto3.client.return_value = mock_client
+        manager = DynamoDBLockManager(table_name="test_locks")
+        manager.release_many(["key_0", "key_1"])
+
+        assert mock_client.batch_write_item.call_count == 2
+        retry_request = mock_client.batch_write_item.call_args_list[1][1]
+        assert retry_request["RequestItems"] == unprocessed
+        mock_sleep.assert_called_once()
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.time.sleep")
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_release_many_gives_up_after_max_attempts(self, mock_boto3, mock_sleep):
+        """Test that release_many stops retrying persistent UnprocessedItems."""
+        mock_client = self._mock_client(mock_boto3)
+        unprocessed = {
+            "test_locks": [
+                {"DeleteRequest": {"Key": {"lock_key": {"S": "key_0"}}}}
+            ]
+        }
+        # Sustained throttling: every attempt returns the same leftovers
+        mock_client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
 
         manager = DynamoDBLockManager(table_name="test_locks")
-        # Should not raise, should handle gracefully
-        manager.release("test_key")
+        manager.release_many(["key_0"])
+
+        assert mock_client.batch_write_item.call_count == 5
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_release_many_empty_list(self, mock_boto3):
+        """Test that release_many with no keys makes no requests."""
+        mock_client = self._mock_client(mock_boto3)
+
+        manager = DynamoDBLockManager(table_name="test_locks")
+        manager.release_many([])
+
+        mock_client.batch_write_item.assert_not_called()
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_get_client_creates_lazy(self, mock_boto3):
         """Test that client is created lazily on first use."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(table_name="test_locks")
-        # Client not created yet
-        mock_boto3.client.assert_not_called()
+        # Session and client not created yet
+        mock_boto3.Session.assert_not_called()
 
-        # First use creates client
+        # First use creates the session and client
         manager.acquire("test_key")
-        mock_boto3.client.assert_called_once_with("dynamodb")
+        mock_boto3.Session.assert_called_once_with()
+        client_call = mock_boto3.Session.return_value.client.call_args
+        assert client_call[0] == ("dynamodb",)
+        # Throttling retries are delegated to botocore's adaptive mode
+        assert client_call[1]["config"].retries == {"mode": "adaptive", "max_attempts": 5}
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_get_client_reuses_instance(self, mock_boto3):
         """Test that client instance is reused."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(table_name="test_locks")
 
@@ -154,25 +370,38 @@ class TestDynamoDBLockManager:
         # Second call should reuse same client
         manager.release("test_key")
 
-        # Client should only be created once
-        assert mock_boto3.client.call_count == 1
+        # Session and client should only be created once
+        assert mock_boto3.Session.call_count == 1
+        assert mock_boto3.Session.return_value.client.call_count == 1
+
+    @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
+    def test_session_shared_across_managers(self, mock_boto3):
+        """Test that managers with the same credentials share one session."""
+        self._mock_client(mock_boto3)
+
+        manager_a = DynamoDBLockManager(table_name="locks_a")
+        manager_b = DynamoDBLockManager(table_name="locks_b")
+        manager_a.acquire("key_a")
+        manager_b.acquire("key_b")
+
+        # Credential resolution runs once; each manager gets its own client
+        assert mock_boto3.Session.call_count == 1
+        assert mock_boto3.Session.return_value.client.call_count == 2
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_get_client_with_region(self, mock_boto3):
         """Test client creation with region."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(table_name="test_locks", region_name="us-west-2")
         manager.acquire("test_key")
 
-        mock_boto3.client.assert_called_once_with("dynamodb", region_name="us-west-2")
+        mock_boto3.Session.assert_called_once_with(region_name="us-west-2")
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_get_client_with_credentials(self, mock_boto3):
         """Test client creation with credentials."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(
             table_name="test_locks",
@@ -181,17 +410,15 @@ class TestDynamoDBLockManager:
         )
         manager.acquire("test_key")
 
-        mock_boto3.client.assert_called_once_with(
-            "dynamodb",
+        mock_boto3.Session.assert_called_once_with(
             aws_access_key_id="key",
             aws_secret_access_key="secret",
         )
 
     @patch("src.infrastructure.lock_managers.dynamodb_lock_manager.boto3")
     def test_get_client_filters_none_values(self, mock_boto3):
-        """Test that None values are filtered from client kwargs."""
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
+        """Test that None values are filtered from session kwargs."""
+        self._mock_client(mock_boto3)
 
         manager = DynamoDBLockManager(
             table_name="test_locks",
@@ -202,4 +429,4 @@ class TestDynamoDBLockManager:
         manager.acquire("test_key")
 
         # Should only pass region_name, not None values
-        mock_boto3.client.assert_called_once_with("dynamodb", region_name="us-east-1")
+        mock_boto3.Session.assert_called_once_with(region_name="us-east-1")
@@ -1,6 +1,6 @@
 """Tests for ETL use case."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import pytest
@@ -141,6 +141,41 @@ class TestETLUseCase:
 
         assert result == []
 
+    def test_execute_applies_window_filter(self):
+        """Test that windowInDays keeps only recent datetime observations."""
+        now = datetime.now(timezone.utc)
+        recent_aware = {"internal_series_code": "TEST_SERIES", "obs_time": now - timedelta(days=1)}
+        recent_naive = {
+            "internal_series_code": "TEST_SERIES",
+            "obs_time": (now - timedelta(days=2)).replace(tzinfo=None),
+        }
+        too_old = {"internal_series_code": "TEST_SERIES", "obs_time": now - timedelta(days=30)}
+        # Strings are not datetimes: skipped with a warning, never kept
+        stringly = {
+            "internal_series_code": "TEST_SERIES",
+            "obs_time": (now - timedelta(days=1)).isoformat(),
+        }
+
+        parser = ETLUseCaseBuilder.create_mock_parser()
+        parser.parse.return_value = [recent_aware, recent_naive, too_old, stringly]
+
+        etl = ETLUseCaseBuilder().with_extractor().with_parser(parser).build()
+        result = etl.execute({"windowInDays": 7})
+
+        assert result == [recent_aware, recent_naive]
+
+    def test_execute_without_window_filter_keeps_all_data(self):
+        """Test that data passes through untouched when windowInDays is unset."""
+        parser = ETLUseCaseBuilder.create_mock_parser()
+        parser.parse.return_value = [
+            {"internal_series_code": "TEST_SERIES", "obs_time": datetime(2020, 1, 1)},
+        ]
+
+        etl = ETLUseCaseBuilder().with_extractor().with_parser(parser).build()
+        result = etl.execute({})
+
+        assert len(result) == 1
+
     def test_execute_without_lock_manager(self):
         """Test execution without lock manager (should work normally)."""
         etl = ETLUseCaseBuilder().with_extractor().with_parser().build()
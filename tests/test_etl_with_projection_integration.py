@@ -1,5 +1,6 @@
 """Integration test for ETL pipeline with projections."""
 
+import io
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -9,33 +10,46 @@ from src.application.projection_use_case import ProjectionUseCase
 from src.infrastructure.projections.projection_manager import ProjectionManager
 from tests.builders import DataPointBuilder
 
+# Built once per module; fixtures hand out copies so tests can't mutate it
+_PARSED_DATA_POINT = (
+    DataPointBuilder().with_series_code("TEST_SERIES").with_value(100.0).build()
+)
 
-class TestETLWithProjectionIntegration:
-    """Integration tests for ETL pipeline with projections."""
 
-    @pytest.fixture
-    def mock_s3_client(self):
-        """Create a mock S3 client."""
-        return Mock()
+@pytest.fixture(scope="module")
+def mock_s3_client():
+    """Create a mock S3 client shared across the module."""
+    return Mock()
 
-    @pytest.fixture
-    def mock_extractor(self):
-        """Create a mock extractor."""
-        extractor = Mock()
-        extractor.extract.return_value = b"mock_data"
-        return extractor
 
-    @pytest.fixture
-    def mock_parser(self):
-        """Create a mock parser."""
-        parser = Mock()
-        parser.parse.return_value = [
-            DataPointBuilder()
-            .with_series_code("TEST_SERIES")
-            .with_value(100.0)
-            .build()
-        ]
-        return parser
+@pytest.fixture(scope="module")
+def mock_extractor():
+    """Create a mock extractor shared across the module."""
+    extractor = Mock()
+    extractor.extract.return_value = b"mock_data"
+    return extractor
+
+
+@pytest.fixture(scope="module")
+def mock_parser():
+    """Create a mock parser shared across the module."""
+    parser = Mock()
+    parser.parse.return_value = [_PARSED_DATA_POINT.copy()]
+    return parser
+
+
+class TestETLWithProjectionIntegration:
+    """Integration tests for ETL pipeline with projections."""
+
+    @pytest.fixture(autouse=True)
+    def reset_shared_mocks(self, mock_s3_client, mock_extractor, mock_parser):
+        """Reset the module-scoped mocks after each test."""
+        yield
+        mock_s3_client.reset_mock(return_value=True, side_effect=True)
+        mock_extractor.reset_mock()
+        mock_extractor.extract.return_value = b"mock_data"
+        mock_parser.reset_mock()
+        mock_parser.parse.return_value = [_PARSED_DATA_POINT.copy()]
 
     @pytest.fixture
     def mock_loader(self, mock_s3_client):
@@ -75,20 +89,7 @@ class TestETLWithProjectionIntegration:
             "load": {"bucket": "test-bucket", "aws_region": "us-east-1"},
         }
 
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_response = {"Body": MockBody(b"v20240115_143022")}
+        mock_response = {"Body": io.BytesIO(b"v20240115_143022")}
         mock_s3_client.get_object.return_value = mock_response
 
         with patch.object(
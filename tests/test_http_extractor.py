@@ -38,33 +38,37 @@ class TestHttpExtractor:
         assert extractor._timeout == 60
         assert extractor._verify_ssl is True
 
-    @patch("src.infrastructure.plugins.extractors.http_extractor.requests.get")
+    @patch("src.infrastructure.plugins.extractors.http_extractor._SESSION.get")
     def test_extract_success(self, mock_get):
         """Test successful extraction."""
         mock_response = Mock()
-        mock_response.content = b"test data"
+        mock_response.iter_content.return_value = [b"test ", b"data"]
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
-        
+
         extractor = HttpExtractor({"url": "https://example.com/data.xlsx"})
         result = extractor.extract()
-        
+
         assert result == b"test data"
         mock_get.assert_called_once_with(
             "https://example.com/data.xlsx",
             timeout=30,
-            verify=False
+            verify=False,
+            stream=True
         )
         mock_response.raise_for_status.assert_called_once()
+        mock_response.iter_content.assert_called_once_with(
+            chunk_size=HttpExtractor.CHUNK_SIZE
+        )
 
-    @patch("src.infrastructure.plugins.extractors.http_extractor.requests.get")
+    @patch("src.infrastructure.plugins.extractors.http_extractor._SESSION.get")
     def test_extract_with_custom_timeout_and_ssl(self, mock_get):
         """Test extraction with custom timeout and SSL verification."""
         mock_response = Mock()
-        mock_response.content = b"test data"
+        mock_response.iter_content.return_value = [b"test data"]
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
-        
+
         config = {
             "url": "https://example.com/data.xlsx",
             "timeout": 60,
@@ -72,14 +76,15 @@ class TestHttpExtractor:
         }
         extractor = HttpExtractor(config)
         extractor.extract()
-        
+
         mock_get.assert_called_once_with(
             "https://example.com/data.xlsx",
             timeout=60,
-            verify=True
+            verify=True,
+            stream=True
         )
 
-    @patch("src.infrastructure.plugins.extractors.http_extractor.requests.get")
+    @patch("src.infrastructure.plugins.extractors.http_extractor._SESSION.get")
     def test_extract_http_error(self, mock_get):
         """Test extraction with HTTP error."""
         mock_response = Mock()
@@ -91,7 +96,7 @@ class TestHttpExtractor:
         with pytest.raises(requests.HTTPError):
             extractor.extract()
 
-    @patch("src.infrastructure.plugins.extractors.http_extractor.requests.get")
+    @patch("src.infrastructure.plugins.extractors.http_extractor._SESSION.get")
     def test_extract_connection_error(self, mock_get):
         """Test extraction with connection error."""
         mock_get.side_effect = requests.ConnectionError("Connection failed")
@@ -16,9 +16,9 @@ class TestIncrementalUpdates:
     """Tests for incremental update functionality."""
 
     @pytest.fixture
-    def temp_state_file(self, tmp_path):
-        """Create a temporary state file."""
-        return str(tmp_path / "incremental_state.json")
+    def state_manager(self):
+        """Create an in-memory state manager (no per-test file I/O)."""
+        return StateManagerBuilder().with_memory().build()
 
     @pytest.fixture
     def sample_config_multiple_series(self):
@@ -47,108 +47,117 @@ class TestIncrementalUpdates:
             .build()
         )
 
-    def test_incremental_first_run_processes_all(self, sample_excel_bytes, sample_parser_config, temp_state_file):
-        """Test that first run processes all data."""
+    def _build_etl(self, sample_excel_bytes, state_manager):
+        """Build an ETL pipeline over the sample workbook."""
         extractor = Mock()
         extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        etl = (
+
+        return (
             ETLUseCaseBuilder()
             .with_extractor(extractor)
             .with_parser(BcraInfomondiaParser())
             .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_config={"kind": "file", "state_file": temp_state_file})
+            .with_state_manager(state_manager)
             .build()
         )
-        
+
+    @staticmethod
+    def _seed_state(state_manager, seed_dates):
+        """Pre-seed per-series last dates into the state manager."""
+        state_manager.save_dates_from_data([
+            {"internal_series_code": code, "obs_time": date}
+            for code, date in seed_dates.items()
+        ])
+
+    @staticmethod
+    def _assert_filtered(result, series_last_dates):
+        """Assert every dated row is past its series' last date."""
+        for item in result:
+            obs_time = item.get("obs_time")
+            series_code = item.get("internal_series_code")
+            if isinstance(obs_time, datetime) and series_code in series_last_dates:
+                obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
+                assert obs_time_naive > series_last_dates[series_code]
+
+    def test_incremental_first_run_processes_all_data(
+        self, sample_excel_bytes, sample_parser_config, state_manager
+    ):
+        """Test that the first run processes all data and records state."""
+        etl = self._build_etl(sample_excel_bytes, state_manager)
+
         result = etl.execute(sample_parser_config)
-        
-        # Should process all data on first run
+
         assert len(result) > 0
-        
-        # State should be saved
-        saved_date = etl.state_manager.get_last_date("TEST_SERIES")
-        assert saved_date is not None
+        assert state_manager.get_last_date("TEST_SERIES") is not None
 
-    def test_incremental_second_run_filters_old_data(
-        self, sample_excel_bytes, sample_parser_config, temp_state_file
+    def test_incremental_second_run_filters_processed_data(
+        self, sample_excel_bytes, sample_parser_config, state_manager
     ):
-        """Test that second run filters data before saved date."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_config={"kind": "file", "state_file": temp_state_file})
-            .build()
-        )
-        
-        # First run
-        result1 = etl.execute(sample_parser_config)
-        first_count = len(result1)
-        
-        # Get saved date
-        saved_date = etl.state_manager.get_last_date("TEST_SERIES")
+        """Test that a second run filters everything at or before the saved date."""
+        etl = self._build_etl(sample_excel_bytes, state_manager)
+
+        first_count = len(etl.execute(sample_parser_config))
+        saved_date = state_manager.get_last_date("TEST_SERIES")
         assert saved_date is not None
-        
-        # Second run
-        result2 = etl.execute(sample_parser_config)
-        second_count = len(result2)
-        
-        # Should filter old data
-        assert second_count < first_count
-        
-        # All dates in second run should be >= saved_date
-        for item in result2:
+
+        result = etl.execute(sample_parser_config)
+
+        assert len(result) < first_count
+        for item in result:
             obs_time = item["obs_time"]
             if isinstance(obs_time, datetime):
                 obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
                 assert obs_time_naive >= saved_date
 
-    def test_incremental_multiple_series_uses_series_dates(
-        self, sample_excel_bytes, sample_config_multiple_series, temp_state_file
+    @pytest.mark.parametrize(
+        "multi_series,seed_dates,unseeded_series",
+        [
+            pytest.param(
+                False,
+                {"TEST_SERIES": datetime(2025, 1, 5)},
+                None,
+                id="boundary",
+            ),
+            pytest.param(
+                True,
+                {"SERIES_1": datetime(2025, 1, 5), "SERIES_2": datetime(2025, 1, 3)},
+                None,
+                id="multi-series",
+            ),
+            pytest.param(
+                True,
+                {"SERIES_1": datetime(2025, 1, 5)},
+                "SERIES_2",
+                id="partial-coverage",
+            ),
+        ],
+    )
+    def test_incremental_filters_against_seeded_state(
+        self,
+        multi_series,
+        seed_dates,
+        unseeded_series,
+        sample_excel_bytes,
+        sample_parser_config,
+        sample_config_multiple_series,
+        state_manager,
     ):
-        """Test that with multiple series, uses minimum date for filtering."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        state_manager = StateManagerBuilder().with_file(temp_state_file).build()
-        # Manually set different dates to test series-specific filtering
-        state_manager.save_dates_from_data([
-            {"internal_series_code": "SERIES_1", "obs_time": datetime(2025, 1, 5)},
-            {"internal_series_code": "SERIES_2", "obs_time": datetime(2025, 1, 3)},  # Earlier date
-        ])
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_manager)
-            .build()
-        )
-        
-        # Get series last dates before running ETL
-        series_last_dates = state_manager.get_series_last_dates(sample_config_multiple_series)
-        assert series_last_dates["SERIES_1"] == datetime(2025, 1, 5)
-        assert series_last_dates["SERIES_2"] == datetime(2025, 1, 3)
-        
-        # Run ETL - should filter by series-specific dates
-        result = etl.execute(sample_config_multiple_series)
-        
-        # Verify all dates in result are > their series' last date (filtered correctly)
-        for item in result:
-            obs_time = item["obs_time"]
-            series_code = item["internal_series_code"]
-            if isinstance(obs_time, datetime) and series_code in series_last_dates:
-                obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
-                assert obs_time_naive > series_last_dates[series_code]
+        """Test that each series filters strictly against its own seeded last date."""
+        config = sample_config_multiple_series if multi_series else sample_parser_config
+        etl = self._build_etl(sample_excel_bytes, state_manager)
+
+        self._seed_state(state_manager, seed_dates)
+        series_last_dates = state_manager.get_series_last_dates(config)
+        assert series_last_dates == seed_dates
+        if unseeded_series:
+            # Series without a saved date process all their data
+            assert unseeded_series not in series_last_dates
+
+        result = etl.execute(config)
+        self._assert_filtered(result, series_last_dates)
 
     def test_incremental_saves_max_date_per_series(
-        self, sample_excel_bytes, sample_parser_config, temp_state_file
+        self, sample_excel_bytes, sample_parser_config, state_manager
     ):
         """Test that saves maximum date for each series."""
         extractor = Mock()
@@ -159,7 +168,7 @@ class TestIncrementalUpdates:
             .with_extractor(extractor)
             .with_parser(BcraInfomondiaParser())
             .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_config={"kind": "file", "state_file": temp_state_file})
+            .with_state_manager(state_manager)
             .build()
         )
         
@@ -179,83 +188,6 @@ class TestIncrementalUpdates:
         saved_date = etl.state_manager.get_last_date("TEST_SERIES")
         assert saved_date == max_date_in_result
 
-    def test_incremental_filters_at_boundary_date(
-        self, sample_excel_bytes, sample_parser_config, temp_state_file
-    ):
-        """Test that filtering works correctly at boundary (date == last_date)."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        state_manager = StateManagerBuilder().with_file(temp_state_file).build()
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_manager)
-            .build()
-        )
-        
-        # First run
-        etl.execute(sample_parser_config)
-        
-        # Manually set a specific date
-        boundary_date = datetime(2025, 1, 5)
-        state_manager.save_dates_from_data([
-            {"internal_series_code": "TEST_SERIES", "obs_time": boundary_date},
-        ])
-        
-        # Second run
-        result2 = etl.execute(sample_parser_config)
-        
-        # Dates <= boundary_date should be filtered
-        for item in result2:
-            obs_time = item["obs_time"]
-            if isinstance(obs_time, datetime):
-                obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
-                # Parser filters date <= last_date, so only > should remain
-                assert obs_time_naive > boundary_date
-
-    def test_incremental_partial_series_coverage(
-        self, sample_excel_bytes, sample_config_multiple_series, temp_state_file
-    ):
-        """Test incremental update when only some series have saved dates."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        state_manager = StateManagerBuilder().with_file(temp_state_file).build()
-        # Save date for only one series BEFORE running ETL
-        state_manager.save_dates_from_data([
-            {"internal_series_code": "SERIES_1", "obs_time": datetime(2025, 1, 5)},
-            # SERIES_2 has no saved date
-        ])
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_manager)
-            .build()
-        )
-        
-        # Get series last dates before running ETL
-        series_last_dates = state_manager.get_series_last_dates(sample_config_multiple_series)
-        assert series_last_dates["SERIES_1"] == datetime(2025, 1, 5)
-        assert "SERIES_2" not in series_last_dates  # No saved date for SERIES_2
-        
-        # Run ETL
-        result = etl.execute(sample_config_multiple_series)
-        
-        # SERIES_1 dates should be > 2025-01-05 (filtered correctly)
-        # SERIES_2 should process all data (no saved date)
-        for item in result:
-            obs_time = item.get("obs_time")
-            series_code = item.get("internal_series_code")
-            if isinstance(obs_time, datetime) and series_code in series_last_dates:
-                obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
-                assert obs_time_naive > series_last_dates[series_code]
-
     def test_incremental_no_state_manager_processes_all(
         self, sample_excel_bytes, sample_parser_config
     ):
@@ -1,24 +1,80 @@
 """Integration tests for the complete ETL flow."""
 
+import contextlib
+import os
 from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
+from src.domain.interfaces import Extractor
 from src.infrastructure.plugins.normalizers.bcra_infomondia_normalizer import (
     BcraInfomondiaNormalizer,
 )
 from src.infrastructure.plugins.parsers.bcra_infomondia_parser import BcraInfomondiaParser
-from tests.builders import ConfigBuilder, ETLUseCaseBuilder, StateManagerBuilder
+from src.infrastructure.state_managers.state_manager_factory import StateManagerFactory
+from tests.builders import CachingParser, ConfigBuilder, ETLUseCaseBuilder
+
+
+@pytest.fixture(scope="module")
+def mock_extractor():
+    """Create a mock extractor shared across the module."""
+    return Mock(spec=Extractor)
+
+
+@pytest.fixture(scope="session")
+def bcra_parser():
+    """Build the (caching) BCRA parser once per session."""
+    return CachingParser(BcraInfomondiaParser())
+
+
+@pytest.fixture(scope="session")
+def bcra_normalizer():
+    """Build the BCRA normalizer once per session."""
+    return BcraInfomondiaNormalizer()
+
+
+@pytest.fixture(scope="module")
+def temp_state_file(tmp_path_factory):
+    """State file path shared across the module; contents reset per test."""
+    return str(tmp_path_factory.mktemp("state") / "test_state.json")
+
+
+@pytest.fixture(scope="module")
+def etl_prototype(mock_extractor, bcra_parser, bcra_normalizer):
+    """Build the ETL use case once; tests swap the state manager per run."""
+    return (
+        ETLUseCaseBuilder()
+        .with_extractor(mock_extractor)
+        .with_parser(bcra_parser)
+        .with_normalizer(bcra_normalizer)
+        .build()
+    )
 
 
 class TestETLIntegration:
     """Integration tests for complete ETL flow."""
 
+    @pytest.fixture(autouse=True)
+    def reset_prototype(
+        self, etl_prototype, mock_extractor, sample_excel_bytes, temp_state_file
+    ):
+        """Reset the shared extractor and clear state between tests."""
+        mock_extractor.reset_mock()
+        mock_extractor.extract.return_value = sample_excel_bytes
+        etl_prototype._state_manager = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_state_file)
+        yield
+
+
     @pytest.fixture
-    def temp_state_file(self, tmp_path):
-        """Create a temporary state file."""
-        return str(tmp_path / "test_state.json")
+    def etl_with_state(self, etl_prototype, temp_state_file):
+        """Shared ETL use case with a fresh file-based state manager."""
+        etl_prototype._state_manager = StateManagerFactory.create(
+            {"kind": "file", "state_file": temp_state_file}
+        )
+        return etl_prototype
 
     @pytest.fixture
     def sample_config(self):
@@ -40,78 +96,41 @@ class TestETLIntegration:
             .build()
         )
 
-    def test_full_etl_flow_with_mock_extractor(
-        self, sample_excel_bytes, sample_config, temp_state_file
-    ):
+    def test_full_etl_flow_with_mock_extractor(self, etl_with_state, sample_config):
         """Test complete ETL flow with mocked extractor."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_config={"kind": "file", "state_file": temp_state_file})
-            .build()
-        )
-        
         # First run
-        result1 = etl.execute(sample_config)
+        result1 = etl_with_state.execute(sample_config)
         assert len(result1) > 0
         assert all("obs_time" in item for item in result1)
         assert all("value" in item for item in result1)
-        
+
         # Verify state was saved
-        saved_date = etl.state_manager.get_last_date("TEST_SERIES")
+        saved_date = etl_with_state.state_manager.get_last_date("TEST_SERIES")
         assert saved_date is not None
-        
+
         # Second run - should filter based on saved date
-        result2 = etl.execute(sample_config)
+        result2 = etl_with_state.execute(sample_config)
         # Should have fewer or equal items (filtered by min_date)
         assert len(result2) <= len(result1)
 
-    def test_etl_flow_without_state_manager(self, sample_excel_bytes, sample_config):
+    def test_etl_flow_without_state_manager(self, etl_prototype, sample_config):
         """Test ETL flow without state manager."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .build()
-        )
-        
-        result = etl.execute(sample_config)
+        result = etl_prototype.execute(sample_config)
         assert len(result) > 0
 
-    def test_etl_flow_incremental_updates(self, sample_excel_bytes, sample_config, temp_state_file):
+    def test_etl_flow_incremental_updates(self, etl_with_state, sample_config):
         """Test that incremental updates work correctly."""
-        extractor = Mock()
-        extractor.extract = Mock(return_value=sample_excel_bytes)
-        
-        etl = (
-            ETLUseCaseBuilder()
-            .with_extractor(extractor)
-            .with_parser(BcraInfomondiaParser())
-            .with_normalizer(BcraInfomondiaNormalizer())
-            .with_state_manager(state_config={"kind": "file", "state_file": temp_state_file})
-            .build()
-        )
-        
         # First run - full extraction
-        result1 = etl.execute(sample_config)
+        result1 = etl_with_state.execute(sample_config)
         first_run_count = len(result1)
-        
+
         # Get saved date
-        saved_date = etl.state_manager.get_last_date("TEST_SERIES")
+        saved_date = etl_with_state.state_manager.get_last_date("TEST_SERIES")
         assert saved_date is not None
-        
+
         # Second run - should filter
-        result2 = etl.execute(sample_config)
-        
+        result2 = etl_with_state.execute(sample_config)
+
         # Verify filtering occurred
         if first_run_count > 0:
             # All dates in second run should be > saved_date
@@ -120,4 +139,3 @@ class TestETLIntegration:
                 if isinstance(obs_time, datetime):
                     obs_time_naive = obs_time.replace(tzinfo=None) if obs_time.tzinfo else obs_time
                     assert obs_time_naive > saved_date or obs_time_naive == saved_date
-
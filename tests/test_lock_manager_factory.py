@@ -18,74 +18,63 @@ class TestLockManagerFactory:
         result = LockManagerFactory.create({})
         assert result is None
 
-    def test_create_dynamodb_with_table_name(self):
-        """Test creating DynamoDB lock manager with table_name."""
-        config = {"kind": "dynamodb", "table_name": "test_locks"}
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"kind": "dynamodb", "table_name": "test_locks"},
+            {"kind": "dynamodb", "table_name": "test_locks", "region_name": "us-west-2"},
+            {
+                "kind": "dynamodb",
+                "table_name": "test_locks",
+                "aws_access_key_id": "test_key",
+                "aws_secret_access_key": "test_secret",
+            },
+            {
+                "kind": "dynamodb",
+                "table_name": "test_locks",
+                "region_name": "us-east-1",
+                "aws_access_key_id": "test_key",
+                "aws_secret_access_key": "test_secret",
+            },
+        ],
+        ids=["table_name_only", "with_region", "with_credentials", "all_parameters"],
+    )
+    def test_create_dynamodb_variants(self, config):
+        """Test creating DynamoDB lock manager from valid config variants."""
         result = LockManagerFactory.create(config)
 
         assert result is not None
         assert hasattr(result, "acquire")
         assert hasattr(result, "release")
 
-    def test_create_dynamodb_with_region(self):
-        """Test creating DynamoDB lock manager with region."""
-        config = {
-            "kind": "dynamodb",
-            "table_name": "test_locks",
-            "region_name": "us-west-2",
-        }
+    @pytest.mark.parametrize(
+        "extra_config,expected",
+        [
+            ({}, True),
+            ({"consistent_read": True}, True),
+            ({"consistent_read": False}, False),
+        ],
+        ids=["default", "explicit_true", "explicit_false"],
+    )
+    def test_create_dynamodb_consistent_read(self, extra_config, expected):
+        """Test that consistent_read is propagated and defaults to True."""
+        config = {"kind": "dynamodb", "table_name": "test_locks", **extra_config}
         result = LockManagerFactory.create(config)
 
-        assert result is not None
-
-    def test_create_dynamodb_with_credentials(self):
-        """Test creating DynamoDB lock manager with credentials."""
-        config = {
-            "kind": "dynamodb",
-            "table_name": "test_locks",
-            "aws_access_key_id": "test_key",
-            "aws_secret_access_key": "test_secret",
-        }
-        result = LockManagerFactory.create(config)
-
-        assert result is not None
-
-    def test_create_dynamodb_missing_table_name(self):
-        """Test that missing table_name raises ValueError."""
-        config = {"kind": "dynamodb"}
-
+        assert result.consistent_read is expected
+
+    @pytest.mark.parametrize(
+        "config,expected_msg",
+        [
+            ({"kind": "dynamodb"}, "table_name"),
+            ({"table_name": "test_locks"}, "kind"),
+            ({"kind": "unknown", "table_name": "test_locks"}, "Unknown lock manager kind"),
+        ],
+        ids=["missing_table_name", "missing_kind", "unknown_kind"],
+    )
+    def test_create_invalid_config_raises(self, config, expected_msg):
+        """Test that invalid configs raise ValueError with a helpful message."""
         with pytest.raises(ValueError) as exc_info:
             LockManagerFactory.create(config)
 
-        assert "table_name" in str(exc_info.value)
-
-    def test_create_missing_kind(self):
-        """Test that missing kind raises ValueError."""
-        config = {"table_name": "test_locks"}
-
-        with pytest.raises(ValueError) as exc_info:
-            LockManagerFactory.create(config)
-
-        assert "kind" in str(exc_info.value)
-
-    def test_create_unknown_kind(self):
-        """Test that unknown kind raises ValueError."""
-        config = {"kind": "unknown", "table_name": "test_locks"}
-
-        with pytest.raises(ValueError) as exc_info:
-            LockManagerFactory.create(config)
-
-        assert "Unknown lock manager kind" in str(exc_info.value)
-
-    def test_create_all_dynamodb_parameters(self):
-        """Test creating DynamoDB lock manager with all parameters."""
-        config = {
-            "kind": "dynamodb",
-            "table_name": "test_locks",
-            "region_name": "us-east-1",
-            "aws_access_key_id": "test_key",
-            "aws_secret_access_key": "test_secret",
-        }
-        result = LockManagerFactory.create(config)
-
-        assert result is not None
+        assert expected_msg in str(exc_info.value)
@@ -1,37 +1,44 @@
 """Tests for plugin initialization."""
 
+import pytest
+
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins import create_plugin_registry, initialize_plugins
+from src.infrastructure.plugins import create_plugin_registry
+
+
+@pytest.fixture(scope="session")
+def initialized_registry():
+    """Registry with all plugins registered, built once per session.
+
+    Plugin discovery is deterministic, so both tests share one registry
+    instead of re-registering every plugin per test.
+    """
+    return create_plugin_registry()
 
 
 class TestPluginInitialization:
     """Tests for plugin initialization functions."""
 
-    def test_initialize_plugins_registers_all(self):
+    def test_initialize_plugins_registers_all(self, initialized_registry):
         """Test that initialize_plugins registers all available plugins."""
-        registry = PluginRegistry()
-        initialize_plugins(registry)
-
         # Verify extractors are registered
         source_config = {"url": "https://example.com"}
-        extractor = registry.get_extractor("http", source_config)
+        extractor = initialized_registry.get_extractor("http", source_config)
         assert extractor is not None
 
         # Verify parsers are registered
-        parser = registry.get_parser("bcra_infomondia")
+        parser = initialized_registry.get_parser("bcra_infomondia")
         assert parser is not None
 
         # Verify normalizers are registered
-        normalizer = registry.get_normalizer("bcra_infomondia")
+        normalizer = initialized_registry.get_normalizer("bcra_infomondia")
         assert normalizer is not None
 
-    def test_create_plugin_registry_returns_initialized(self):
-        """Test that create_plugin_registry returns initialized registry."""
-        registry = create_plugin_registry()
-
-        assert isinstance(registry, PluginRegistry)
+    def test_create_plugin_registry_returns_initialized(self, initialized_registry):
+        """Test that create_plugin_registry returns an initialized registry."""
+        assert isinstance(initialized_registry, PluginRegistry)
 
         # Verify plugins are registered
         source_config = {"url": "https://example.com"}
-        extractor = registry.get_extractor("http", source_config)
+        extractor = initialized_registry.get_extractor("http", source_config)
         assert extractor is not None
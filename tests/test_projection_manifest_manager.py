@@ -1,8 +1,10 @@
 """Tests for ProjectionManifestManager."""
 
-import json
+import io
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
+import orjson
 import pytest
 from botocore.exceptions import ClientError
 
@@ -11,18 +13,98 @@ from src.infrastructure.projections.projection_manifest_manager import (
 )
 
 
+_FROZEN_NOW = datetime(2024, 1, 17, 9, 30, 0, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    """datetime stand-in whose now() is pinned to _FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+class _S3Body(io.BytesIO):
+    """Minimal stand-in for an S3 response body (read + context manager)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# Serialized once at import time; each test wraps them in a fresh _S3Body.
+_MANIFEST_WITHOUT_TARGET = orjson.dumps(
+    {
+        "projected_versions": ["v20240114_120000", "v20240116_150000"],
+        "last_projection_date": "2024-01-16T15:00:00Z",
+        "last_projected_version": "v20240116_150000",
+    }
+)
+
+_MANIFEST_WITH_TARGET = orjson.dumps(
+    {
+        "projected_versions": ["v20240114_120000", "v20240115_143022", "v20240116_150000"],
+        "last_projection_date": "2024-01-16T15:00:00Z",
+        "last_projected_version": "v20240116_150000",
+    }
+)
+
+_MANIFEST_PRIOR_VERSION = orjson.dumps(
+    {
+        "projected_versions": ["v20240114_120000"],
+        "last_projection_date": "2024-01-14T12:00:00Z",
+        "last_projected_version": "v20240114_120000",
+    }
+)
+
+_MANIFEST_ALREADY_PROJECTED = orjson.dumps(
+    {
+        "projected_versions": ["v20240115_143022"],
+        "last_projection_date": "2024-01-15T14:30:22Z",
+        "last_projected_version": "v20240115_143022",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def mock_s3_client():
+    """Create a mock S3 client shared across the module.
+
+    The narrow spec keeps attribute lookup on a fixed set of methods and
+    turns typos into AttributeError instead of silent child mocks.
+    """
+    return Mock(spec=["get_object", "put_object", "copy_object", "list_objects_v2", "delete_object"])
+
+
+@pytest.fixture(scope="module")
+def manifest_manager(mock_s3_client):
+    """Create ProjectionManifestManager instance shared across the module."""
+    return ProjectionManifestManager(bucket="test-bucket", s3_client=mock_s3_client)
+
+
+# Keep each module's tests on one xdist worker so the module-scoped
+# mock fixtures are built once per run.
+pytestmark = pytest.mark.xdist_group(name="projection_manifest")
+
+
 class TestProjectionManifestManager:
     """Tests for ProjectionManifestManager class."""
 
-    @pytest.fixture
-    def mock_s3_client(self):
-        """Create a mock S3 client."""
-        return Mock()
+    @pytest.fixture(autouse=True)
+    def reset_mock_s3_client(self, mock_s3_client):
+        """Reset the shared mock S3 client after each test."""
+        yield
+        mock_s3_client.reset_mock(return_value=True, side_effect=True)
 
-    @pytest.fixture
-    def manifest_manager(self, mock_s3_client):
-        """Create ProjectionManifestManager instance."""
-        return ProjectionManifestManager(bucket="test-bucket", s3_client=mock_s3_client)
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, monkeypatch):
+        """Pin the manifest manager's clock so date assertions are exact."""
+        monkeypatch.setattr(
+            "src.infrastructure.projections.projection_manifest_manager.datetime",
+            _FrozenDatetime,
+        )
 
     def test_is_version_projected_returns_false_when_manifest_not_exists(
         self, manifest_manager, mock_s3_client
@@ -39,28 +121,7 @@ class TestProjectionManifestManager:
         self, manifest_manager, mock_s3_client
     ):
         """Test that is_version_projected returns False when version is not in list."""
-        manifest = {
-            "projected_versions": ["v20240114_120000", "v20240116_150000"],
-            "last_projection_date": "2024-01-16T15:00:00Z",
-            "last_projected_version": "v20240116_150000",
-        }
-
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_s3_client.get_object.return_value = {
-            "Body": MockBody(json.dumps(manifest).encode("utf-8"))
-        }
+        mock_s3_client.get_object.return_value = {"Body": _S3Body(_MANIFEST_WITHOUT_TARGET)}
 
         result = manifest_manager.is_version_projected("test_dataset", "v20240115_143022")
 
@@ -70,28 +131,7 @@ class TestProjectionManifestManager:
         self, manifest_manager, mock_s3_client
     ):
         """Test that is_version_projected returns True when version is in list."""
-        manifest = {
-            "projected_versions": ["v20240114_120000", "v20240115_143022", "v20240116_150000"],
-            "last_projection_date": "2024-01-16T15:00:00Z",
-            "last_projected_version": "v20240116_150000",
-        }
-
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_s3_client.get_object.return_value = {
-            "Body": MockBody(json.dumps(manifest).encode("utf-8"))
-        }
+        mock_s3_client.get_object.return_value = {"Body": _S3Body(_MANIFEST_WITH_TARGET)}
 
         result = manifest_manager.is_version_projected("test_dataset", "v20240115_143022")
 
@@ -111,113 +151,48 @@ class TestProjectionManifestManager:
         assert call_args[1]["Bucket"] == "test-bucket"
         assert call_args[1]["Key"] == "datasets/test_dataset/projections/manifest.json"
 
-        saved_manifest = json.loads(call_args[1]["Body"].decode("utf-8"))
-        assert "v20240115_143022" in saved_manifest["projected_versions"]
+        saved_manifest = orjson.loads(call_args[1]["Body"])
+        assert saved_manifest["projected_versions"] == ["v20240115_143022"]
         assert saved_manifest["last_projected_version"] == "v20240115_143022"
-        assert saved_manifest["last_projection_date"] is not None
+        assert saved_manifest["last_projection_date"] == "2024-01-17T09:30:00Z"
 
     def test_add_projected_version_appends_to_existing_manifest(
         self, manifest_manager, mock_s3_client
     ):
         """Test that add_projected_version appends version to existing manifest."""
-        existing_manifest = {
-            "projected_versions": ["v20240114_120000"],
-            "last_projection_date": "2024-01-14T12:00:00Z",
-            "last_projected_version": "v20240114_120000",
-        }
-
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_s3_client.get_object.return_value = {
-            "Body": MockBody(json.dumps(existing_manifest).encode("utf-8"))
-        }
+        mock_s3_client.get_object.return_value = {"Body": _S3Body(_MANIFEST_PRIOR_VERSION)}
 
         manifest_manager.add_projected_version("test_dataset", "v20240115_143022")
 
         call_args = mock_s3_client.put_object.call_args
-        saved_manifest = json.loads(call_args[1]["Body"].decode("utf-8"))
-        assert len(saved_manifest["projected_versions"]) == 2
-        assert "v20240114_120000" in saved_manifest["projected_versions"]
-        assert "v20240115_143022" in saved_manifest["projected_versions"]
+        saved_manifest = orjson.loads(call_args[1]["Body"])
+        assert set(saved_manifest["projected_versions"]) == {
+            "v20240114_120000",
+            "v20240115_143022",
+        }
         assert saved_manifest["last_projected_version"] == "v20240115_143022"
 
     def test_add_projected_version_does_not_duplicate_version(
         self, manifest_manager, mock_s3_client
     ):
         """Test that add_projected_version does not add duplicate versions."""
-        existing_manifest = {
-            "projected_versions": ["v20240115_143022"],
-            "last_projection_date": "2024-01-15T14:30:22Z",
-            "last_projected_version": "v20240115_143022",
-        }
-
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_s3_client.get_object.return_value = {
-            "Body": MockBody(json.dumps(existing_manifest).encode("utf-8"))
-        }
+        mock_s3_client.get_object.return_value = {"Body": _S3Body(_MANIFEST_ALREADY_PROJECTED)}
 
         manifest_manager.add_projected_version("test_dataset", "v20240115_143022")
 
         call_args = mock_s3_client.put_object.call_args
-        saved_manifest = json.loads(call_args[1]["Body"].decode("utf-8"))
-        assert len(saved_manifest["projected_versions"]) == 1
-        assert saved_manifest["projected_versions"].count("v20240115_143022") == 1
+        saved_manifest = orjson.loads(call_args[1]["Body"])
+        assert saved_manifest["projected_versions"] == ["v20240115_143022"]
 
     def test_add_projected_version_updates_last_projection_metadata(
         self, manifest_manager, mock_s3_client
     ):
         """Test that add_projected_version updates last projection date and version."""
-        existing_manifest = {
-            "projected_versions": ["v20240114_120000"],
-            "last_projection_date": "2024-01-14T12:00:00Z",
-            "last_projected_version": "v20240114_120000",
-        }
-
-        class MockBody:
-            def __init__(self, data):
-                self._data = data
-
-            def read(self):
-                return self._data
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        mock_s3_client.get_object.return_value = {
-            "Body": MockBody(json.dumps(existing_manifest).encode("utf-8"))
-        }
+        mock_s3_client.get_object.return_value = {"Body": _S3Body(_MANIFEST_PRIOR_VERSION)}
 
         manifest_manager.add_projected_version("test_dataset", "v20240115_143022")
 
         call_args = mock_s3_client.put_object.call_args
-        saved_manifest = json.loads(call_args[1]["Body"].decode("utf-8"))
+        saved_manifest = orjson.loads(call_args[1]["Body"])
         assert saved_manifest["last_projected_version"] == "v20240115_143022"
-        assert saved_manifest["last_projection_date"] is not None
-        assert saved_manifest["last_projection_date"] != "2024-01-14T12:00:00Z"
-
+        assert saved_manifest["last_projection_date"] == "2024-01-17T09:30:00Z"
@@ -25,11 +25,6 @@ class TestProjectionMerger:
         """Create ProjectionMerger instance."""
         return ProjectionMerger(bucket="test-bucket", s3_client=mock_s3_client)
 
-    @pytest.fixture
-    def projection_merger_parallel(self, mock_s3_client):
-        """Create ProjectionMerger instance with parallel workers."""
-        return ProjectionMerger(bucket="test-bucket", s3_client=mock_s3_client, merge_workers=3)
-
     @pytest.fixture
     def sample_data_staging(self):
         """Create sample data for staging."""
@@ -85,8 +80,9 @@ class TestProjectionMerger:
                     json_item[key] = value
             json_data.append(json_item)
         
+        # Compact separators mirror the production writer's output shape
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            json.dump(json_data, f, separators=(",", ":"))
 
     def test_merge_partition_with_no_existing_projection(
         self, projection_merger, mock_s3_client, sample_data_staging
@@ -174,7 +170,7 @@ class TestProjectionMerger:
             uploaded_files = []
             uploaded_content = []
 
-            def capture_upload(LocalFilename, _Bucket, Key):  # noqa: N803
+            def capture_upload(LocalFilename, _Bucket, Key, **_kwargs):  # noqa: N803
                 uploaded_files.append((LocalFilename, Key))
                 # Read file content before it's deleted
                 if Path(LocalFilename).exists():
@@ -240,7 +236,7 @@ class TestProjectionMerger:
 
             uploaded_content = []
 
-            def capture_upload(LocalFilename, _Bucket, _Key):  # noqa: N803
+            def capture_upload(LocalFilename, _Bucket, _Key, **_kwargs):  # noqa: N803
                 # Read file content before it's deleted
                 if Path(LocalFilename).exists():
                     with open(LocalFilename, encoding="utf-8") as f:
@@ -308,12 +304,16 @@ class TestProjectionMerger:
             assert mock_s3_client.upload_file.called
 
     def test_merge_all_partitions_calls_merge_for_each_partition(
-        self, projection_merger
+        self, projection_merger, mock_s3_client
     ):
         """Test that merge_all_partitions calls merge_partition for each partition."""
 
         dataset_id = "test_dataset"
 
+        # Prefix listing returns no keys; no previous merge state
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
+        self._prime_no_merge_state(mock_s3_client)
+
         # Mock StagingManager to return multiple partitions
         with patch(
             "src.infrastructure.projections.projection_merger.StagingManager"
@@ -333,12 +333,20 @@ class TestProjectionMerger:
                 # Verify merge_partition was called for each partition
                 assert mock_merge_partition.call_count == 2
                 mock_merge_partition.assert_any_call(
-                    dataset_id, "SERIES_1/year=2024/month=01"
+                    dataset_id, "SERIES_1/year=2024/month=01", {}, {}
                 )
                 mock_merge_partition.assert_any_call(
-                    dataset_id, "SERIES_2/year=2024/month=02"
+                    dataset_id, "SERIES_2/year=2024/month=02", {}, {}
                 )
 
+    @staticmethod
+    def _prime_no_merge_state(mock_s3_client):
+        """Helper to make get_object report no stored merge state."""
+        from botocore.exceptions import ClientError
+
+        error_response = {"Error": {"Code": "NoSuchKey"}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, "GetObject")
+
     def test_s3_object_exists_raises_non_404_errors(
         self, projection_merger, mock_s3_client
     ):
@@ -378,10 +386,8 @@ class TestProjectionMerger:
         # Verify upload was not called (no data to merge)
         mock_s3_client.upload_file.assert_not_called()
 
-    def test_merge_all_partitions_uses_parallel_workers(
-        self, projection_merger_parallel
-    ):
-        """Test that merge_all_partitions uses parallel workers when configured."""
+    def test_merge_all_partitions_uses_parallel_workers(self, mock_s3_client):
+        """Test that merge_all_partitions reuses the pool created at construction."""
         dataset_id = "test_dataset"
         partitions = [
             "SERIES_1/year=2024/month=01",
@@ -393,47 +399,52 @@ class TestProjectionMerger:
         mock_staging_manager = Mock()
         mock_staging_manager.list_staging_partitions.return_value = partitions
 
+        from concurrent.futures import Future
+
+        # Create futures that will be returned by submit
+        futures_list = []
+        for _ in partitions:
+            future = Future()
+            future.set_result(None)
+            futures_list.append(future)
+
+        mock_executor = Mock()
+        # Make submit return futures in order
+        futures_copy = list(futures_list)
+        mock_executor.submit = Mock(
+            side_effect=lambda *args: futures_copy.pop(0) if futures_copy else Future()
+        )
+
+        # Prefix listing returns no keys; no previous merge state
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
+        self._prime_no_merge_state(mock_s3_client)
+
         with patch(
             "src.infrastructure.projections.projection_merger.StagingManager",
             return_value=mock_staging_manager,
         ), patch(
-            "src.infrastructure.projections.projection_merger.ThreadPoolExecutor"
+            "src.infrastructure.projections.projection_merger.ThreadPoolExecutor",
+            return_value=mock_executor,
         ) as mock_executor_class, patch(
-            "src.infrastructure.projections.projection_merger.as_completed"
-        ), patch.object(
-            projection_merger_parallel, "merge_partition"
+            "src.infrastructure.projections.projection_merger.as_completed",
+            return_value=futures_list,
         ):
-            from concurrent.futures import Future
-
-            # Create futures that will be returned by submit
-            futures_list = []
-            for _ in partitions:
-                future = Future()
-                future.set_result(None)
-                futures_list.append(future)
-
-            mock_executor = Mock()
-            mock_executor.__enter__ = Mock(return_value=mock_executor)
-            mock_executor.__exit__ = Mock(return_value=None)
-            # Make submit return futures in order
-            futures_copy = list(futures_list)
-            mock_executor.submit = Mock(
-                side_effect=lambda *args: futures_copy.pop(0) if futures_copy else Future()
+            merger = ProjectionMerger(
+                bucket="test-bucket", s3_client=mock_s3_client, merge_workers=3
             )
-            mock_executor_class.return_value = mock_executor
+            merger.merge_all_partitions(dataset_id)
 
-            # Mock as_completed to return futures
-            with patch(
-                "src.infrastructure.projections.projection_merger.as_completed",
-                return_value=futures_list,
-            ):
-                projection_merger_parallel.merge_all_partitions(dataset_id)
+            # Pool is created once, at construction time
+            mock_executor_class.assert_called_once_with(
+                max_workers=3, thread_name_prefix="proj-merge"
+            )
+            assert mock_executor.submit.call_count == 3
 
-            # Verify ThreadPoolExecutor was created with correct workers
-            mock_executor_class.assert_called_once_with(max_workers=3)
+            merger.close()
+            mock_executor.shutdown.assert_called_once_with(wait=True)
 
     def test_merge_all_partitions_sequential_with_one_worker(
-        self, projection_merger
+        self, projection_merger, mock_s3_client
     ):
         """Test that merge_all_partitions works with 1 worker (sequential behavior)."""
         dataset_id = "test_dataset"
@@ -446,6 +457,13 @@ class TestProjectionMerger:
         mock_staging_manager = Mock()
         mock_staging_manager.list_staging_partitions.return_value = partitions
 
+        # Prefix listing returns one staging key; no previous merge state
+        listed_key = f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": listed_key, "ETag": '"etag-1"'}]}
+        ]
+        self._prime_no_merge_state(mock_s3_client)
+
         with patch(
             "src.infrastructure.projections.projection_merger.StagingManager",
             return_value=mock_staging_manager,
@@ -454,7 +472,49 @@ class TestProjectionMerger:
         ) as mock_merge_partition:
             projection_merger.merge_all_partitions(dataset_id)
 
-            # Verify merge_partition was called for each partition
+            # Verify merge_partition was called for each partition with the
+            # pre-listed keys
             assert mock_merge_partition.call_count == 2
-            mock_merge_partition.assert_any_call(dataset_id, "SERIES_1/year=2024/month=01")
-            mock_merge_partition.assert_any_call(dataset_id, "SERIES_2/year=2024/month=02")
+            mock_merge_partition.assert_any_call(
+                dataset_id, "SERIES_1/year=2024/month=01", {listed_key: '"etag-1"'}, {}
+            )
+            mock_merge_partition.assert_any_call(
+                dataset_id, "SERIES_2/year=2024/month=02", {listed_key: '"etag-1"'}, {}
+            )
+
+            # The listing is scoped to the consulted areas, not the whole
+            # dataset prefix (which would sweep historical versions)
+            for area in ("staging", "projections"):
+                mock_s3_client.get_paginator.return_value.paginate.assert_any_call(
+                    Bucket="test-bucket", Prefix=f"datasets/{dataset_id}/{area}/"
+                )
+
+    def test_merge_workers_auto_sized_when_none(self, mock_s3_client):
+        """Test that merge_workers=None sizes the pool from the CPU count."""
+        merger = ProjectionMerger(
+            bucket="test-bucket", s3_client=mock_s3_client, merge_workers=None
+        )
+        try:
+            assert 4 <= merger._merge_workers <= 32  # noqa: SLF001
+            assert merger._executor is not None  # noqa: SLF001
+        finally:
+            merger.close()
+
+    def test_merge_partition_skips_when_staging_etag_unchanged(
+        self, projection_merger, mock_s3_client
+    ):
+        """Test that merge_partition skips partitions with an unchanged staging ETag."""
+        dataset_id = "test_dataset"
+        partition_path = "SERIES_1/year=2024/month=01"
+        staging_key = f"datasets/{dataset_id}/staging/{partition_path}/data.json"
+
+        existing_keys = {staging_key: '"etag-1"'}
+        merge_state = {partition_path: '"etag-1"'}
+
+        projection_merger.merge_partition(
+            dataset_id, partition_path, existing_keys, merge_state
+        )
+
+        # Nothing should be downloaded or uploaded for an unchanged partition
+        mock_s3_client.download_file.assert_not_called()
+        mock_s3_client.upload_file.assert_not_called()
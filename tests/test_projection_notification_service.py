@@ -40,6 +40,7 @@ class TestProjectionNotificationService:
             version_manifest_path=version_manifest_path,
             projections_path=projections_path,
         )
+        service.flush()
 
         # Assert
         mock_http_client.post.assert_called_once()
@@ -73,6 +74,7 @@ class TestProjectionNotificationService:
             version_manifest_path="datasets/test_dataset/versions/v1/manifest.json",
             projections_path="datasets/test_dataset/projections/",
         )
+        service.flush()
 
         # Should have attempted to post
         mock_http_client.post.assert_called_once()
@@ -96,11 +98,55 @@ class TestProjectionNotificationService:
             version_manifest_path="datasets/test_dataset/versions/v1/manifest.json",
             projections_path="datasets/test_dataset/projections/",
         )
+        service.flush()
 
         # Assert
         call_args = mock_http_client.post.call_args
         assert call_args.kwargs["timeout"] == 30.0
 
+    def test_instances_share_one_worker_thread(self):
+        """Test that repeated instantiation does not accumulate workers."""
+        import threading
+
+        # Arrange - two services, as a server handling two requests builds
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_http_client = MagicMock()
+        mock_http_client.post.return_value = mock_response
+
+        # Act
+        for _ in range(2):
+            service = ProjectionNotificationService(
+                base_url="http://localhost:3000", http_client=mock_http_client
+            )
+            service.notify_projection_update(
+                dataset_id="test_dataset",
+                bucket="test-bucket",
+                version_manifest_path="datasets/test_dataset/versions/v1/manifest.json",
+                projections_path="datasets/test_dataset/projections/",
+            )
+            service.flush()
+
+        # Assert - both services posted through a single shared worker
+        assert mock_http_client.post.call_count == 2
+        workers = [
+            thread for thread in threading.enumerate()
+            if thread.name == "projection-notify"
+        ]
+        assert len(workers) == 1
+
+    def test_flush_registered_at_interpreter_exit(self):
+        """Test that the shared queue is drained once at interpreter exit."""
+        import importlib
+
+        import src.infrastructure.notifications.projection_notification_service as module
+
+        # Registration happens at import, so observe it through a reload
+        with patch.object(module.atexit, "register") as mock_register:
+            importlib.reload(module)
+
+        mock_register.assert_called_once_with(module._SHARED_QUEUE.join)  # noqa: SLF001
+
     def test_notify_projection_update_strips_trailing_slash_from_base_url(self):
         """Test that notify_projection_update strips trailing slash from base_url."""
         # Arrange
@@ -122,6 +168,7 @@ class TestProjectionNotificationService:
             version_manifest_path="datasets/test_dataset/versions/v1/manifest.json",
             projections_path="datasets/test_dataset/projections/",
         )
+        service.flush()
 
         # Assert
         call_args = mock_http_client.post.call_args
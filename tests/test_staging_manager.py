@@ -26,46 +26,110 @@ class TestStagingManager:
         """Create StagingManager instance with parallel workers."""
         return StagingManager(bucket="test-bucket", s3_client=mock_s3_client, copy_workers=3)
 
-    def test_copy_from_version_copies_single_file(self, staging_manager, mock_s3_client):
-        """Test that copy_from_version copies a single JSON file from version to staging."""
+    @staticmethod
+    def _prime_empty_staging(mock_s3_client):
+        """Make head_object report staging objects as absent (first copy)."""
+        error_response = {"Error": {"Code": "404"}}
+        mock_s3_client.head_object.side_effect = ClientError(error_response, "HeadObject")
+
+    @pytest.mark.parametrize(
+        ("copy_workers", "json_files"),
+        [
+            pytest.param(
+                32,
+                ["SERIES_1/year=2024/month=01/data.json"],
+                id="single-file",
+            ),
+            pytest.param(
+                32,
+                [
+                    "SERIES_1/year=2024/month=01/data.json",
+                    "SERIES_2/year=2024/month=02/data.json",
+                ],
+                id="multiple-files",
+            ),
+            pytest.param(
+                1,
+                [
+                    "SERIES_1/year=2024/month=01/data.json",
+                    "SERIES_2/year=2024/month=02/data.json",
+                ],
+                id="sequential-one-worker",
+            ),
+        ],
+    )
+    def test_copy_from_version_copies_files(self, mock_s3_client, copy_workers, json_files):
+        """Test that copy_from_version copies every JSON file from version to staging."""
+        staging_manager = StagingManager(
+            bucket="test-bucket", s3_client=mock_s3_client, copy_workers=copy_workers
+        )
         dataset_id = "test_dataset"
         version_id = "v20240115_143022"
-        json_files = ["SERIES_1/year=2024/month=01/data.json"]
 
-        # Mock S3 copy operation
-        mock_s3_client.copy_object = Mock()
+        self._prime_empty_staging(mock_s3_client)
 
         result = staging_manager.copy_from_version(version_id, dataset_id, json_files)
 
-        # Verify copy was called with correct source and destination
-        expected_source = f"datasets/{dataset_id}/versions/{version_id}/data/{json_files[0]}"
-        expected_dest = f"datasets/{dataset_id}/staging/{json_files[0]}"
+        # Verify each copy used the correct source and destination
+        assert mock_s3_client.copy_object.call_count == len(json_files)
+        for json_file in json_files:
+            mock_s3_client.copy_object.assert_any_call(
+                CopySource={
+                    "Bucket": "test-bucket",
+                    "Key": f"datasets/{dataset_id}/versions/{version_id}/data/{json_file}",
+                },
+                Bucket="test-bucket",
+                Key=f"datasets/{dataset_id}/staging/{json_file}",
+            )
 
-        mock_s3_client.copy_object.assert_called_once_with(
-            CopySource={"Bucket": "test-bucket", "Key": expected_source},
-            Bucket="test-bucket",
-            Key=expected_dest,
-        )
+        expected_paths = [f"datasets/{dataset_id}/staging/{json_file}" for json_file in json_files]
+        assert sorted(result) == sorted(expected_paths)
+
+    def test_copy_from_version_skips_unchanged_staging_object(
+        self, staging_manager, mock_s3_client
+    ):
+        """Test that an unchanged staging object is not copied again."""
+        dataset_id = "test_dataset"
+        version_id = "v20240115_143022"
+        json_files = ["SERIES_1/year=2024/month=01/data.json"]
+
+        # Staging and source report the same ETag
+        mock_s3_client.head_object.return_value = {"ETag": '"abc123"'}
+
+        result = staging_manager.copy_from_version(version_id, dataset_id, json_files)
 
-        # Verify return value
+        mock_s3_client.copy_object.assert_not_called()
+        # The skipped file still counts as staged
         assert result == [f"datasets/{dataset_id}/staging/{json_files[0]}"]
 
-    def test_copy_from_version_copies_multiple_files(self, staging_manager, mock_s3_client):
-        """Test that copy_from_version copies multiple JSON files."""
+    def test_copy_from_version_copies_when_etag_differs(self, staging_manager, mock_s3_client):
+        """Test that a stale staging object is overwritten."""
         dataset_id = "test_dataset"
         version_id = "v20240115_143022"
-        json_files = [
-            "SERIES_1/year=2024/month=01/data.json",
-            "SERIES_2/year=2024/month=02/data.json",
+        json_files = ["SERIES_1/year=2024/month=01/data.json"]
+
+        # Staging exists but with a different ETag than the source
+        mock_s3_client.head_object.side_effect = [
+            {"ETag": '"stale"'},
+            {"ETag": '"fresh"'},
         ]
 
-        mock_s3_client.copy_object = Mock()
+        staging_manager.copy_from_version(version_id, dataset_id, json_files)
 
-        result = staging_manager.copy_from_version(version_id, dataset_id, json_files)
+        mock_s3_client.copy_object.assert_called_once()
+
+    def test_copy_from_version_non_idempotent_skips_head_checks(
+        self, staging_manager, mock_s3_client
+    ):
+        """Test that idempotent=False copies unconditionally without HeadObject."""
+        dataset_id = "test_dataset"
+        version_id = "v20240115_143022"
+        json_files = ["SERIES_1/year=2024/month=01/data.json"]
 
-        # Verify all files were copied
-        assert mock_s3_client.copy_object.call_count == 2
-        assert len(result) == 2
+        staging_manager.copy_from_version(version_id, dataset_id, json_files, idempotent=False)
+
+        mock_s3_client.head_object.assert_not_called()
+        mock_s3_client.copy_object.assert_called_once()
 
     def test_list_staging_partitions_returns_empty_list_when_no_partitions(
         self, staging_manager, mock_s3_client
@@ -74,14 +138,15 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock empty S3 response
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"Contents": []}]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
         assert result == []
-        mock_s3_client.list_objects_v2.assert_called_once_with(
+        mock_s3_client.get_paginator.return_value.paginate.assert_any_call(
             Bucket="test-bucket",
             Prefix=f"datasets/{dataset_id}/staging/",
+            PaginationConfig={"PageSize": 1000},
         )
 
     def test_list_staging_partitions_extracts_partitions(self, staging_manager, mock_s3_client):
@@ -89,7 +154,7 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response with multiple files in same partition
-        mock_s3_client.list_objects_v2.return_value = {
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{
             "Contents": [
                 {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
                 {
@@ -97,7 +162,7 @@ class TestStagingManager:
                 },
                 {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
             ]
-        }
+        }]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -109,35 +174,61 @@ class TestStagingManager:
         assert sorted(result) == sorted(expected_partitions)
 
     def test_clear_staging_deletes_all_files(self, staging_manager, mock_s3_client):
-        """Test that clear_staging deletes all files in staging."""
+        """Test that clear_staging deletes all files in one batch call."""
         dataset_id = "test_dataset"
+        keys = [
+            f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json",
+            f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json",
+        ]
 
         # Mock S3 response with files
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
-        mock_s3_client.delete_object = Mock()
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": key} for key in keys]}
+        ]
+        mock_s3_client.delete_objects.return_value = {}
 
         staging_manager.clear_staging(dataset_id)
 
-        # Verify delete was called for each file
-        assert mock_s3_client.delete_object.call_count == 2
+        # Verify both keys were deleted in a single batch
+        mock_s3_client.delete_objects.assert_called_once_with(
+            Bucket="test-bucket",
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
+    def test_clear_staging_raises_on_partial_delete_failure(
+        self, staging_manager, mock_s3_client
+    ):
+        """Test that clear_staging surfaces per-key DeleteObjects failures."""
+        dataset_id = "test_dataset"
+        keys = [
+            f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json",
+            f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json",
+        ]
+
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": key} for key in keys]}
+        ]
+        # Quiet mode reports failures in Errors instead of raising
+        mock_s3_client.delete_objects.return_value = {
+            "Errors": [
+                {"Key": keys[0], "Code": "AccessDenied", "Message": "Access Denied"}
+            ]
+        }
+
+        with pytest.raises(RuntimeError, match="Failed to delete 1 of 2"):
+            staging_manager.clear_staging(dataset_id)
 
     def test_clear_staging_handles_empty_staging(self, staging_manager, mock_s3_client):
         """Test that clear_staging handles empty staging gracefully."""
         dataset_id = "test_dataset"
 
         # Mock empty S3 response
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
-        mock_s3_client.delete_object = Mock()
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"Contents": []}]
 
         staging_manager.clear_staging(dataset_id)
 
         # Verify delete was not called
-        mock_s3_client.delete_object.assert_not_called()
+        mock_s3_client.delete_objects.assert_not_called()
 
     def test_list_staging_partitions_handles_response_without_contents_key(
         self, staging_manager, mock_s3_client
@@ -146,7 +237,7 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response without Contents key
-        mock_s3_client.list_objects_v2.return_value = {}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -158,7 +249,9 @@ class TestStagingManager:
 
         # Mock ClientError with NoSuchKey
         error_response = {"Error": {"Code": "NoSuchKey"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -172,7 +265,9 @@ class TestStagingManager:
 
         # Mock ClientError with different error code
         error_response = {"Error": {"Code": "AccessDenied"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         with pytest.raises(ClientError):
             staging_manager.list_staging_partitions(dataset_id)
@@ -183,34 +278,42 @@ class TestStagingManager:
 
         # Mock ClientError with NoSuchKey
         error_response = {"Error": {"Code": "NoSuchKey"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         # Should not raise, should return gracefully
         staging_manager.clear_staging(dataset_id)
 
-    def test_list_staging_partitions_filters_keys_without_prefix(
+    def test_list_staging_partitions_lists_only_staging_prefix(
         self, staging_manager, mock_s3_client
     ):
-        """Test that list_staging_partitions filters out keys that don't start with prefix."""
+        """Test that list_staging_partitions scopes the listing to the staging prefix."""
         dataset_id = "test_dataset"
 
-        # Mock S3 response with a key that doesn't match the prefix
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {"Key": f"datasets/{dataset_id}/other/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
+        # Mock S3 response; S3 guarantees keys share the requested prefix
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                ]
+            }
+        ]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
-        # Should only return partition for key that matches prefix
         assert result == ["SERIES_1/year=2024/month=01"]
+        mock_s3_client.get_paginator.return_value.paginate.assert_any_call(
+            Bucket="test-bucket",
+            Prefix=f"datasets/{dataset_id}/staging/",
+            PaginationConfig={"PageSize": 1000},
+        )
 
     def test_copy_from_version_uses_parallel_workers(
         self, staging_manager_parallel, mock_s3_client
     ):
         """Test that copy_from_version uses parallel workers when configured."""
+        from concurrent.futures import ThreadPoolExecutor
         from unittest.mock import patch
 
         dataset_id = "test_dataset"
@@ -221,57 +324,107 @@ class TestStagingManager:
             "SERIES_3/year=2024/month=03/data.json",
         ]
 
-        mock_s3_client.copy_object = Mock()
+        self._prime_empty_staging(mock_s3_client)
+
+        # Wrap the real executor so the copies actually run while the
+        # constructor arguments stay observable.
+        with patch(
+            "src.infrastructure.projections.staging_manager.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor_spy:
+            result = staging_manager_parallel.copy_from_version(
+                version_id, dataset_id, json_files
+            )
+
+        executor_spy.assert_called_once()
+        assert executor_spy.call_args.kwargs["max_workers"] == 3
+        assert mock_s3_client.copy_object.call_count == 3
+        assert len(result) == 3
+
+    def test_list_staging_partitions_fans_out_across_series_prefixes(
+        self, staging_manager, mock_s3_client
+    ):
+        """Test that listings fan out per series prefix when several exist."""
+        dataset_id = "test_dataset"
+        staging_prefix = f"datasets/{dataset_id}/staging/"
+        series_prefixes = [f"{staging_prefix}SERIES_1/", f"{staging_prefix}SERIES_2/"]
+
+        def paginate_side_effect(**kwargs):
+            if "Delimiter" in kwargs:
+                return [
+                    {"CommonPrefixes": [{"Prefix": prefix} for prefix in series_prefixes]}
+                ]
+            series_prefix = kwargs["Prefix"]
+            return [{"Contents": [{"Key": f"{series_prefix}year=2024/month=01/data.json"}]}]
+
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = paginate_side_effect
+
+        result = staging_manager.list_staging_partitions(dataset_id)
+
+        assert result == [
+            "SERIES_1/year=2024/month=01",
+            "SERIES_2/year=2024/month=01",
+        ]
+        for series_prefix in series_prefixes:
+            mock_s3_client.get_paginator.return_value.paginate.assert_any_call(
+                Bucket="test-bucket",
+                Prefix=series_prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+
+    def test_owned_client_pool_sized_to_copy_workers(self):
+        """Test that a self-created client sizes its pool from copy_workers."""
+        from unittest.mock import patch
+
+        with patch("src.infrastructure.utils.aws_utils.boto3") as mock_boto3:
+            StagingManager(bucket="test-bucket", copy_workers=16)
+
+            _, kwargs = mock_boto3.client.call_args
+            assert kwargs["config"].max_pool_connections == 32
+
+    def test_clear_staging_uses_parallel_workers_for_multiple_batches(
+        self, staging_manager_parallel, mock_s3_client
+    ):
+        """Test that clear_staging deletes multiple batches in parallel."""
+        from unittest.mock import patch
+
+        dataset_id = "test_dataset"
+        # 1001 keys split into two DeleteObjects batches
+        keys = [
+            f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/part-{i:05d}.json"
+            for i in range(1001)
+        ]
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": key} for key in keys]}
+        ]
+        mock_s3_client.delete_objects.return_value = {}
 
         with patch(
             "src.infrastructure.projections.staging_manager.ThreadPoolExecutor"
         ) as mock_executor_class:
-            mock_executor = Mock()
-            mock_executor.__enter__ = Mock(return_value=mock_executor)
-            mock_executor.__exit__ = Mock(return_value=None)
-
-            # Mock as_completed to return futures
             from concurrent.futures import Future
 
             futures = []
-            for json_file in json_files:
-                future = Future()
-                future.set_result(f"datasets/{dataset_id}/staging/{json_file}")
-                futures.append(future)
 
             def submit_side_effect(func, *args):
                 future = Future()
                 future.set_result(func(*args))
+                futures.append(future)
                 return future
 
+            mock_executor = Mock()
+            mock_executor.__enter__ = Mock(return_value=mock_executor)
+            mock_executor.__exit__ = Mock(return_value=None)
             mock_executor.submit = Mock(side_effect=submit_side_effect)
             mock_executor_class.return_value = mock_executor
 
             with patch(
                 "src.infrastructure.projections.staging_manager.as_completed",
-                return_value=futures,
+                side_effect=lambda mapping: list(mapping),
             ):
-                result = staging_manager_parallel.copy_from_version(version_id, dataset_id, json_files)
+                staging_manager_parallel.clear_staging(dataset_id)
 
-            # Verify ThreadPoolExecutor was created with correct workers
+            # Verify batches were fanned out on the configured workers
             mock_executor_class.assert_called_once_with(max_workers=3)
-            assert len(result) == 3
-
-    def test_copy_from_version_sequential_with_one_worker(
-        self, staging_manager, mock_s3_client
-    ):
-        """Test that copy_from_version works sequentially with 1 worker."""
-        dataset_id = "test_dataset"
-        version_id = "v20240115_143022"
-        json_files = [
-            "SERIES_1/year=2024/month=01/data.json",
-            "SERIES_2/year=2024/month=02/data.json",
-        ]
-
-        mock_s3_client.copy_object = Mock()
-
-        result = staging_manager.copy_from_version(version_id, dataset_id, json_files)
+            assert mock_s3_client.delete_objects.call_count == 2
 
-        # Verify all files were copied (sequential or parallel, result should be same)
-        assert mock_s3_client.copy_object.call_count == 2
-        assert len(result) == 2
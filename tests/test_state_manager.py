@@ -1,6 +1,5 @@
 """Tests for StateManager."""
 
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -13,17 +12,23 @@ class TestStateManager:
     """Tests for StateManager class."""
 
     @pytest.fixture
-    def temp_state_file(self):
-        """Create a temporary state file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = f.name
-        yield temp_path
-        Path(temp_path).unlink(missing_ok=True)
+    def temp_state_file(self, tmp_path):
+        """Path for a state file in pytest's per-test temp dir.
+
+        The file itself is not pre-created; FileStateManager handles a
+        missing file, and cleanup is left to pytest.
+        """
+        return str(tmp_path / "state.json")
 
     @pytest.fixture
-    def state_manager(self, temp_state_file):
-        """Create a StateManager instance with temp file."""
-        return StateManagerBuilder().with_file(temp_state_file).build()
+    def state_manager(self):
+        """Create an in-memory StateManager instance.
+
+        The save/load behavior under test is backend-independent, so
+        most tests skip the disk round trip; persistence itself is
+        covered by the file-backed tests below.
+        """
+        return StateManagerBuilder().with_memory().build()
 
     def test_get_last_date_nonexistent_series(self, state_manager):
         """Test getting last date for non-existent series."""
@@ -93,6 +98,24 @@ class TestStateManager:
         assert state_manager.get_last_date("SERIES_2") is None
         assert state_manager.get_last_date("SERIES_3") is None
 
+    def test_save_dates_from_data_large_batch(self, state_manager):
+        """Test that large batches take the vectorized reduction path."""
+        from datetime import timedelta
+
+        base = datetime(2025, 1, 1)
+        data = [
+            {
+                "internal_series_code": f"SERIES_{i % 5}",
+                "obs_time": base + timedelta(minutes=i),
+            }
+            for i in range(2001)
+        ]
+
+        state_manager.save_dates_from_data(data)
+
+        assert state_manager.get_last_date("SERIES_0") == base + timedelta(minutes=2000)
+        assert state_manager.get_last_date("SERIES_4") == base + timedelta(minutes=1999)
+
     def test_get_series_last_dates_no_series(self, state_manager):
         """Test getting series last dates with no series in config."""
         config = {"parse_config": {"series_map": []}}
@@ -168,6 +191,32 @@ class TestStateManager:
         manager2 = StateManagerBuilder().with_file(temp_state_file).build()
         assert manager2.get_last_date("SERIES_1") == datetime(2025, 1, 15)
 
+    def test_save_skips_identical_state(self, temp_state_file):
+        """Test that saving unchanged state performs no file write."""
+        from unittest.mock import patch
+
+        manager = StateManagerBuilder().with_file(temp_state_file).build()
+        data = [
+            {"internal_series_code": "SERIES_1", "obs_time": datetime(2025, 1, 15)},
+        ]
+        manager.save_dates_from_data(data)
+
+        with patch(
+            "src.infrastructure.state_managers.file_state_manager.os.replace"
+        ) as mock_replace:
+            manager.save_dates_from_data(data)
+            mock_replace.assert_not_called()
+
+    def test_save_leaves_no_temp_file(self, temp_state_file):
+        """Test that the atomic write cleans up its temp file."""
+        manager = StateManagerBuilder().with_file(temp_state_file).build()
+        manager.save_dates_from_data([
+            {"internal_series_code": "SERIES_1", "obs_time": datetime(2025, 1, 15)},
+        ])
+
+        assert not Path(temp_state_file + ".tmp").exists()
+        assert manager.get_last_date("SERIES_1") == datetime(2025, 1, 15)
+
     def test_load_handles_invalid_json(self, temp_state_file):
         """Test that loading handles invalid JSON gracefully."""
         # Write invalid JSON to file
@@ -3,6 +3,7 @@
 import pytest
 
 from src.infrastructure.state_managers.file_state_manager import FileStateManager
+from src.infrastructure.state_managers.memory_state_manager import MemoryStateManager
 from src.infrastructure.state_managers.s3_state_manager import S3StateManager
 from src.infrastructure.state_managers.state_manager_factory import StateManagerFactory
 
@@ -84,6 +85,14 @@ class TestStateManagerFactory:
         with pytest.raises(ValueError, match="S3 state manager requires 'bucket' and 'key'"):
             StateManagerFactory.create(config)
 
+    def test_create_memory(self):
+        """Test creating MemoryStateManager."""
+        config = {"kind": "memory"}
+        result = StateManagerFactory.create(config)
+
+        assert isinstance(result, MemoryStateManager)
+        assert result.get_last_date("ANY_SERIES") is None
+
     def test_create_unknown_kind_raises_error(self):
         """Test that unknown kind raises ValueError."""
         config = {"kind": "unknown"}
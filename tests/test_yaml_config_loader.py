@@ -65,6 +65,35 @@ class TestYamlConfigLoader:
         result = config_loader.load_dataset_config("empty")
         assert result == {}
 
+    def test_load_dataset_config_caches_parsed_document(self, config_loader, temp_config_dir):
+        """Test that repeated loads reuse the parsed document."""
+        config_file = temp_config_dir / "cached.yml"
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"dataset_id": "cached"}, f)
+
+        first = config_loader.load_dataset_config("cached")
+        second = config_loader.load_dataset_config("cached")
+
+        assert second is first
+
+    def test_load_dataset_config_reloads_after_file_change(self, config_loader, temp_config_dir):
+        """Test that editing the config file invalidates the cache."""
+        import os
+
+        config_file = temp_config_dir / "changing.yml"
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"value": 1}, f)
+
+        assert config_loader.load_dataset_config("changing") == {"value": 1}
+
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"value": 2}, f)
+        # Force a distinct mtime even on coarse-grained filesystems
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert config_loader.load_dataset_config("changing") == {"value": 2}
+
     def test_load_dataset_config_prefers_yml_over_yaml(self, config_loader, temp_config_dir):
         """Test that .yml is preferred over .yaml."""
         yml_data = {"dataset_id": "test", "source": "yml"}